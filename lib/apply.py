@@ -54,6 +54,43 @@ except ImportError:
             print(f"[DEBUG] {message}")
 
 
+def create_http_session(pool_maxsize: int = 4):
+    """
+    Create a requests session for the Topdesk API.
+
+    The session keeps connections alive between calls and retries
+    requests that hit a transient gateway error. Only idempotent methods
+    are retried, so PATCH updates are left to the processor's own retry
+    handling.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections to keep open
+
+    Returns:
+        Configured requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class APLProcessor:
     """Processes APL files and applies changes to Topdesk."""
 
@@ -96,6 +133,9 @@ class APLProcessor:
         self.topdesk_username = topdesk_username or os.environ.get('TOPDESK_USERNAME')
         self.topdesk_api_key = topdesk_api_key or os.environ.get('TOPDESK_API_KEY')
 
+        # Pooled HTTP session for direct API calls, created on first use
+        self._http_session = None
+
         # Check if topdesk command is available
         self.cli_available = self._check_cli_availability()
         self.use_api_directly = not self.cli_available
@@ -185,6 +225,14 @@ class APLProcessor:
             if not self._test_cli_connection():
                 raise ConnectionError("Failed to authenticate with topdesk command")
 
+    def _get_http_session(self):
+        """Get the shared HTTP session, creating it on first use."""
+        if self._http_session is None:
+            self._http_session = create_http_session(
+                pool_maxsize=max(4, self.parallel_workers)
+            )
+        return self._http_session
+
     def _test_api_connection(self) -> bool:
         """Test direct API connection."""
         try:
@@ -201,7 +249,7 @@ class APLProcessor:
             }
 
             # Test with a simple API call
-            response = requests.get(
+            response = self._get_http_session().get(
                 f"{self.topdesk_url}/tas/api/assetmgmt/assets",
                 headers=headers,
                 params={'pageSize': 1},
@@ -463,7 +511,7 @@ class APLProcessor:
                 'Content-Type': 'application/json'
             }
 
-            response = requests.get(
+            response = self._get_http_session().get(
                 f"{self.topdesk_url}/tas/api/assetmgmt/assets/{asset_id}",
                 headers=headers,
                 timeout=30
@@ -706,7 +754,7 @@ class APLProcessor:
             # Transform fields to API format
             api_payload = self._transform_fields_for_api(fields)
 
-            response = requests.patch(
+            response = self._get_http_session().patch(
                 f"{self.topdesk_url}/tas/api/assetmgmt/assets/{asset_id}",
                 headers=headers,
                 json=api_payload,
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+JSON Codec - Shared JSON decoding for the merger tool modules.
+Uses orjson when it is installed and can decode a document exactly.
+"""
+
+import re
+import json
+from typing import Any
+
+# Optional faster JSON decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Digit runs long enough to hold an integer outside the range orjson
+# decodes exactly (-2**63 to 2**64 - 1); orjson turns those into floats
+_LONG_NUMBER = re.compile(rb'\d{19,}').search
+
+
+def decode_json(raw: bytes) -> Any:
+    """
+    Decode a JSON document.
+
+    orjson is used when it can decode the document exactly. Documents
+    with long digit runs, which may hold integers orjson would silently
+    turn into floats, go through the json module, as do documents orjson
+    rejects (NaN/Infinity literals, invalid JSON).
+
+    Args:
+        raw: Document contents
+
+    Returns:
+        Decoded data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None and not _LONG_NUMBER(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
@@ -5,17 +5,44 @@ Provides command-line interface for log analysis and visualization.
 """
 
 import argparse
-import sys
 import re
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
-from collections import Counter
+from typing import Optional
 import json
 
 # Import the LogAnalyzer from logger module
 from logger import LogAnalyzer, MergerLogger
 
+# Optional Aho-Corasick automaton for level detection when coloring lines
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Widest histogram bar; rows slice this instead of rebuilding it
+_BAR = '█' * 50
+
+# Write buffer for exports, so large error sets flush in few syscalls
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Color codes for different log levels
+_LEVEL_COLORS = {
+    'TRACE': '\033[90m',     # Gray
+    'DEBUG': '\033[36m',     # Cyan
+    'INFO': '\033[32m',      # Green
+    'WARNING': '\033[33m',   # Yellow
+    'ERROR': '\033[91m',     # Light Red
+    'CRITICAL': '\033[31m',  # Red
+}
+_COLOR_RESET = '\033[0m'
+
+# Fallback matcher used when pyahocorasick is not installed
+_LEVEL_TAG_RE = re.compile(
+    r'\[(' + '|'.join(_LEVEL_COLORS) + r')\]'
+)
+
 
 class LogViewer:
     """Interactive log viewer and analyzer."""
@@ -24,6 +51,19 @@ class LogViewer:
         """Initialize the log viewer."""
         self.analyzer = LogAnalyzer(log_path)
         self.log_path = Path(log_path)
+        self._level_automaton = self._build_level_automaton()
+
+    @staticmethod
+    def _build_level_automaton():
+        """Build a single-pass matcher for the ``[LEVEL]`` tags, if available."""
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for level in _LEVEL_COLORS:
+            automaton.add_word(f'[{level}]', level)
+        automaton.make_automaton()
+        return automaton
 
     def view_tail(self, lines: int = 50, follow: bool = False):
         """
@@ -53,8 +93,9 @@ class LogViewer:
             except KeyboardInterrupt:
                 print("\n\nStopped following log.")
         else:
-            tail_lines = self.analyzer.tail(lines)
-            for line in tail_lines:
+            # LogAnalyzer.tail reads the file backwards, so only the
+            # requested lines are touched
+            for line in self.analyzer.tail(lines):
                 self._print_colored_line(line)
 
     def view_errors(self, last_n: Optional[int] = None, verbose: bool = False):
@@ -173,19 +214,19 @@ class LogViewer:
             print(f"\nErrors: {len(results['errors'])}")
             print("Recent errors:")
             for error in results['errors'][-5:]:
-                print(f"  Line {error['line']}: [{error['agent']}] {error['message'][:60]}...")
+                print(f"  Line {error.line}: [{error.agent}] {error.message[:60]}...")
 
         if results['warnings']:
             print(f"\nWarnings: {len(results['warnings'])}")
             print("Recent warnings:")
             for warning in results['warnings'][-5:]:
-                print(f"  Line {warning['line']}: [{warning['agent']}] {warning['message'][:60]}...")
+                print(f"  Line {warning.line}: [{warning.agent}] {warning.message[:60]}...")
 
         if results['timeline']:
             print(f"\nActivity Timeline (hourly):")
             sorted_timeline = sorted(results['timeline'].items())
             for hour, count in sorted_timeline[-10:]:
-                bar = '█' * min(50, count // 2)
+                bar = _BAR[:min(50, count // 2)]
                 print(f"  {hour}: {bar} ({count})")
 
     def search_log(self, pattern: str, context: int = 0, show_line_numbers: bool = True):
@@ -203,7 +244,7 @@ class LogViewer:
             print(f"No matches found for pattern: {pattern}")
             return
 
-        print(f"\nFound {len(set(m[0] for m in matches))} matching line(s):\n")
+        print(f"\nFound {len(matches)} matching line(s):\n")
         print("=" * 80)
 
         last_line_num = -1
@@ -235,42 +276,44 @@ class LogViewer:
         output_path = Path(output_file)
 
         if format == 'json':
-            with open(output_path, 'w') as f:
+            with open(output_path, 'w', buffering=_EXPORT_BUFFER_SIZE) as f:
                 json.dump(errors, f, indent=2)
         elif format == 'csv':
             import csv
-            with open(output_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['line_number', 'timestamp',
-                                                       'agent', 'level', 'message'])
-                writer.writeheader()
-                writer.writerows(errors)
+            fieldnames = ('line_number', 'timestamp', 'agent', 'level', 'message')
+            with open(output_path, 'w', newline='',
+                      buffering=_EXPORT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(
+                    [error[field] for field in fieldnames] for error in errors
+                )
         else:  # text
-            with open(output_path, 'w') as f:
-                for error in errors:
-                    f.write(f"[{error['timestamp']}] [{error['level']}] "
-                           f"[{error['agent']}] Line {error['line_number']}: "
-                           f"{error['message']}\n")
+            with open(output_path, 'w', buffering=_EXPORT_BUFFER_SIZE) as f:
+                f.writelines(
+                    f"[{error['timestamp']}] [{error['level']}] "
+                    f"[{error['agent']}] Line {error['line_number']}: "
+                    f"{error['message']}\n"
+                    for error in errors
+                )
 
         print(f"Exported {len(errors)} errors to {output_path}")
 
     def _print_colored_line(self, line: str):
         """Print a log line with color coding."""
-        # Color codes for different log levels
-        colors = {
-            'TRACE': '\033[90m',     # Gray
-            'DEBUG': '\033[36m',     # Cyan
-            'INFO': '\033[32m',      # Green
-            'WARNING': '\033[33m',   # Yellow
-            'ERROR': '\033[91m',     # Light Red
-            'CRITICAL': '\033[31m',  # Red
-        }
-        reset = '\033[0m'
-
-        # Try to identify log level in line
-        for level, color in colors.items():
-            if f'[{level}]' in line:
-                print(f"{color}{line}{reset}")
-                return
+        # Identify the log level in a single scan over the line
+        level = None
+        if self._level_automaton is not None:
+            for _, level in self._level_automaton.iter(line):
+                break
+        else:
+            match = _LEVEL_TAG_RE.search(line)
+            if match:
+                level = match.group(1)
+
+        if level:
+            print(f"{_LEVEL_COLORS[level]}{line}{_COLOR_RESET}")
+            return
 
         # Default: no color
         print(line)
@@ -302,7 +345,7 @@ class LogViewer:
             count = results['by_level'].get(level, 0)
             if total_by_level > 0:
                 pct = (count / total_by_level) * 100
-                bar = '█' * int(pct / 2)
+                bar = _BAR[:int(pct / 2)]
                 print(f"{level:10} {count:6,} ({pct:5.1f}%) {bar}")
             else:
                 print(f"{level:10} {count:6,}")
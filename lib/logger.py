@@ -7,6 +7,8 @@ Provides structured logging with levels, rotation, and analysis capabilities.
 import os
 import sys
 import json
+import atexit
+import queue
 import time
 import logging
 import traceback
@@ -14,12 +16,239 @@ import threading
 import subprocess
 import shlex
 import re
+import mmap
+import heapq
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple, Union
-from logging.handlers import RotatingFileHandler
-from collections import defaultdict, Counter
-import inspect
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from collections import defaultdict, Counter, deque, namedtuple
+from functools import lru_cache
+
+# Optional faster JSON encoder for the log formatters
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Sensitive command-line values and their replacements, applied in order:
+# --password/--token/--api-key/--secret flags, password=/token= pairs and
+# bearer tokens. Each pattern runs over the output of the previous ones, so
+# a value one pattern leaves in place (such as the one after
+# "Bearer --password") is still masked by another. A flag followed by
+# another flag has no value of its own and does not consume the next flag
+_MASK_PATTERNS = [
+    (re.compile(r'--password(?:=| (?!--))\S+', re.IGNORECASE), '--password=***'),
+    (re.compile(r'--token(?:=| (?!--))\S+', re.IGNORECASE), '--token=***'),
+    (re.compile(r'--api-key(?:=| (?!--))\S+', re.IGNORECASE), '--api-key=***'),
+    (re.compile(r'--secret(?:=| (?!--))\S+', re.IGNORECASE), '--secret=***'),
+    (re.compile(r'password=\S+', re.IGNORECASE), 'password=***'),
+    (re.compile(r'token=\S+', re.IGNORECASE), 'token=***'),
+    (re.compile(r'Bearer \S+', re.IGNORECASE), 'Bearer ***'),
+]
+
+# Whitespace-separated command arguments
+_ARG_RE = re.compile(r'\S+')
+
+
+# LogRecord attributes (and the caller context set by MergerLogger._log)
+# that JsonFormatter does not copy as extra fields
+_RESERVED_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName', 'levelname',
+    'levelno', 'lineno', 'module', 'msecs', 'message', 'pathname', 'process',
+    'processName', 'relativeCreated', 'thread', 'threadName', 'taskName',
+    'agent', 'caller_file', 'caller_func', 'caller_line', 'exc_info',
+    'exc_text', 'stack_info'
+})
+
+
+# Serializes stopping and restarting queue listeners; QueueListener.stop()
+# is not safe to call from two threads at once
+_listener_lock = threading.Lock()
+
+
+def _detach_queue_handler(target: logging.Logger, handler: QueueHandler) -> None:
+    """
+    Remove a queue handler from a logger and shut down its listener.
+
+    The listener drains any queued records before it stops, then the file
+    handlers it wrote to are closed (which also ends their flush threads).
+    Handlers that were already detached are left alone, so this is safe
+    to call twice.
+
+    Args:
+        target: Logger the handler may be attached to
+        handler: QueueHandler created by MergerLogger._queue_handler
+    """
+    target.removeHandler(handler)
+    with _listener_lock:
+        listener = getattr(handler, 'listener', None)
+        if listener is None:
+            return
+        handler.listener = None
+        listener.stop()
+    for file_handler in listener.handlers:
+        file_handler.close()
+
+
+# Text-format log line: [timestamp] [LEVEL] [AGENT] message
+_TEXT_LINE_RE = re.compile(
+    r'\[([\d-]+\s[\d:]+\.[\d]+)\]\s+\[(\w+)\]\s+\[(\w+)\]\s+(.*)'
+)
+
+# Same pattern, matched against raw bytes when analyzing a mapped file
+_TEXT_LINE_BYTES_RE = re.compile(_TEXT_LINE_RE.pattern.encode())
+
+# Error/warning entry collected by LogAnalyzer.analyze
+LogEntry = namedtuple('LogEntry', 'line agent message')
+
+# Level names reported by LogAnalyzer.get_errors
+_ERROR_LEVELS = frozenset({'ERROR', 'CRITICAL'})
+
+# Main-log lines written for CLI commands by MergerLogger.log_command
+_COMMAND_RE = re.compile(r'Command executed:', re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _user_regex(pattern: str) -> re.Pattern:
+    """Compile a user-supplied search pattern (case-insensitive), cached."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO timestamp with a space or 'T' separator, cached."""
+    return datetime.fromisoformat(timestamp.replace(' ', 'T'))
+
+
+# Bytes scanned per step when searching a mapped log
+_SEARCH_BLOCK_SIZE = 1 << 20
+
+# Any non-ASCII byte in a mapped log
+_NON_ASCII_RE = re.compile(rb'[\x80-\xff]')
+
+
+def _is_iso_like(timestamp: str) -> bool:
+    """Cheap pre-check: every format fromisoformat accepts opens with YYYY."""
+    return timestamp[:4].isdigit()
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """
+    Convert a log entry timestamp to a datetime.
+
+    Args:
+        value: ISO timestamp string or epoch seconds
+
+    Returns:
+        The datetime, or None if the value is missing or not a timestamp
+    """
+    if isinstance(value, str):
+        if not _is_iso_like(value):
+            return None
+        try:
+            return _parse_iso(value)
+        except ValueError:
+            return None
+    if value is None:
+        return None
+    try:
+        return datetime.fromtimestamp(value)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+# Characters that make a search pattern more than a plain literal
+_REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+def _literal_hint(pattern: str) -> Optional[str]:
+    """
+    Return the lower-cased pattern if it is a plain ASCII literal.
+
+    Such patterns can be ruled out with a substring test on the lower-cased
+    line, which is much cheaper than running the regex.
+    """
+    if pattern.isascii() and not _REGEX_METACHARS.intersection(pattern):
+        return pattern.lower()
+    return None
+
+
+def _may_contain(line: str, needle: str) -> bool:
+    """
+    Cheap pre-check for a case-insensitive ASCII literal.
+
+    Returns False only when the needle cannot occur in the line. Non-ASCII
+    lines always pass, since regex case folding there goes beyond lower().
+    """
+    return not line.isascii() or needle in line.lower()
+
+
+# Block size for reading command output pipes in execute_command
+_PIPE_READ_SIZE = 64 * 1024
+
+# Seconds to wait for the pipe readers after killing a timed out command
+_READER_JOIN_TIMEOUT = 0.1
+
+# Block size used when reading the command log backwards
+_REVERSE_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_lines_reverse(path: Path, chunk_size: int = _REVERSE_CHUNK_SIZE):
+    """
+    Yield the lines of a file from last to first.
+
+    The file is read backwards in fixed-size blocks, so callers that stop
+    early only pay for the tail of the file.
+
+    Args:
+        path: File to read
+        chunk_size: Number of bytes read per block
+
+    Yields:
+        Decoded lines without the trailing newline
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        pos = f.tell()
+        partial = b''
+        while pos > 0:
+            size = min(chunk_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + partial).split(b'\n')
+            # The first piece may continue in the previous block
+            partial = lines[0]
+            for line in reversed(lines[1:]):
+                yield line.decode('utf-8', errors='replace')
+        yield partial.decode('utf-8', errors='replace')
+
+
+def _json_default(obj):
+    """Serialize datetimes the way orjson does for the stdlib fallback."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document; raises ValueError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    """Encode a log entry as a single-line JSON string."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Integers wider than 64 bits and other values orjson cannot
+            # encode; the json module handles what it can
+            pass
+    return json.dumps(obj, default=_json_default)
 
 
 class MergerLogger:
@@ -34,6 +263,17 @@ class MergerLogger:
     CRITICAL = logging.CRITICAL
     COMMAND = 25  # New level for CLI command logging
 
+    # Level number -> name for the levels above, used by the stats counters
+    _LEVEL_NAMES = {
+        TRACE: 'TRACE',
+        DEBUG: 'DEBUG',
+        INFO: 'INFO',
+        COMMAND: 'COMMAND',
+        WARNING: 'WARNING',
+        ERROR: 'ERROR',
+        CRITICAL: 'CRITICAL'
+    }
+
     def __init__(
         self,
         output_dir: str = "./output",
@@ -43,7 +283,8 @@ class MergerLogger:
         backup_count: int = 5,
         log_level: int = INFO,
         console_output: bool = True,
-        json_format: bool = False
+        json_format: bool = False,
+        mirror_to_main: bool = True
     ):
         """
         Initialize the merger logger.
@@ -57,6 +298,8 @@ class MergerLogger:
             log_level: Minimum log level to record
             console_output: Whether to mirror logs to console
             json_format: Whether to use JSON formatting
+            mirror_to_main: Whether successful CLI commands are also written
+                to the main log (failed commands always are)
         """
         self.output_dir = Path(output_dir)
         self.log_filename = log_filename
@@ -66,14 +309,15 @@ class MergerLogger:
         self.log_level = log_level
         self.console_output = console_output
         self.json_format = json_format
+        self.mirror_to_main = mirror_to_main
 
         # Statistics tracking
         self.stats = {
             'total_messages': 0,
             'by_level': Counter(),
             'by_agent': Counter(),
-            'errors': [],
-            'commands': []  # Track CLI commands
+            'errors': deque(maxlen=100),  # Most recent errors
+            'commands': deque(maxlen=100)  # Most recent CLI commands
         }
         self.stats_lock = threading.Lock()
 
@@ -89,6 +333,17 @@ class MergerLogger:
         }
         self.command_stats_lock = threading.Lock()
 
+        # Caller filename -> basename, filled lazily by _log
+        self._basename_cache: Dict[str, str] = {}
+
+        # Agent name -> interned upper-case name, filled lazily by _log
+        self._agent_cache: Dict[str, str] = {}
+
+        # Queue handlers (with their background listeners) and the file
+        # handlers the listeners write to
+        self._queue_handlers: List[Tuple[logging.Logger, QueueHandler]] = []
+        self._file_handlers: List[logging.Handler] = []
+
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -96,9 +351,8 @@ class MergerLogger:
         self._setup_logger()
         self._setup_command_logger()
 
-        # Add custom log levels
-        logging.addLevelName(self.TRACE, "TRACE")
-        logging.addLevelName(self.COMMAND, "COMMAND")
+        # Drain queued records before the interpreter exits
+        atexit.register(self.close)
 
         # Log initial startup
         self.info("SYSTEM", "Merger logger initialized")
@@ -108,12 +362,13 @@ class MergerLogger:
         self.logger = logging.getLogger('merger')
         self.logger.setLevel(self.TRACE)
 
-        # Clear any existing handlers
-        self.logger.handlers = []
+        # Clear any existing handlers, stopping the listeners of a logger
+        # instance set up earlier on the same logging.Logger
+        self._clear_handlers(self.logger)
 
         # File handler with rotation
         log_path = self.output_dir / self.log_filename
-        file_handler = RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_path,
             maxBytes=self.max_bytes,
             backupCount=self.backup_count
@@ -130,7 +385,8 @@ class MergerLogger:
             )
             file_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
+        self.log_file_handler = file_handler
+        self.logger.addHandler(self._queue_handler(self.logger, file_handler))
 
         # Console handler if requested
         if self.console_output:
@@ -151,13 +407,16 @@ class MergerLogger:
         """Setup dedicated logger for command audit trail."""
         self.command_logger = logging.getLogger('merger.commands')
         self.command_logger.setLevel(logging.DEBUG)
+        # Command entries only go to the audit file, not to the 'merger'
+        # handlers as empty messages
+        self.command_logger.propagate = False
 
         # Clear any existing handlers
-        self.command_logger.handlers = []
+        self._clear_handlers(self.command_logger)
 
         # Command log file handler
         command_log_path = self.output_dir / self.command_log_filename
-        command_handler = RotatingFileHandler(
+        command_handler = BufferedRotatingFileHandler(
             command_log_path,
             maxBytes=self.max_bytes,
             backupCount=self.backup_count
@@ -166,7 +425,68 @@ class MergerLogger:
 
         # Always use JSON format for command logs
         command_handler.setFormatter(CommandJsonFormatter())
-        self.command_logger.addHandler(command_handler)
+        self.command_logger.addHandler(
+            self._queue_handler(self.command_logger, command_handler)
+        )
+
+    @staticmethod
+    def _clear_handlers(target: logging.Logger) -> None:
+        """Remove all handlers from a logger, stopping queue listeners."""
+        for handler in list(target.handlers):
+            if isinstance(handler, QueueHandler):
+                _detach_queue_handler(target, handler)
+            else:
+                target.removeHandler(handler)
+
+    def _queue_handler(self, target: logging.Logger,
+                       handler: logging.Handler) -> QueueHandler:
+        """
+        Move a file handler onto a background listener thread.
+
+        Callers only enqueue records; formatting, writes and rotation
+        happen on the listener thread.
+
+        Args:
+            target: Logger the returned handler will be attached to
+            handler: Handler performing the actual file I/O
+
+        Returns:
+            QueueHandler to attach to the logger in its place
+        """
+        record_queue = queue.SimpleQueue()
+        listener = QueueListener(record_queue, handler, respect_handler_level=True)
+        listener.start()
+
+        queue_handler = QueueHandler(record_queue)
+        queue_handler.setLevel(handler.level)
+        queue_handler.listener = listener
+
+        self._queue_handlers.append((target, queue_handler))
+        self._file_handlers.append(handler)
+        return queue_handler
+
+    def flush(self):
+        """Wait until all queued records have been written to disk."""
+        with _listener_lock:
+            for _, queue_handler in self._queue_handlers:
+                listener = queue_handler.listener
+                if listener is not None:
+                    # stop() drains the queue and joins the thread; restart
+                    # afterwards
+                    listener.stop()
+                    listener.start()
+        for handler in self._file_handlers:
+            handler.flush()
+
+    def close(self):
+        """Drain queued records, detach the queue handlers and close the log files."""
+        atexit.unregister(self.close)
+        queue_handlers, self._queue_handlers = self._queue_handlers, []
+        for target, queue_handler in queue_handlers:
+            _detach_queue_handler(target, queue_handler)
+        handlers, self._file_handlers = self._file_handlers, []
+        for handler in handlers:
+            handler.close()
 
     def _log(self, level: int, agent: str, message: str, **kwargs):
         """
@@ -178,43 +498,74 @@ class MergerLogger:
             message: Log message
             **kwargs: Additional context data
         """
+        # Records below the configured level are dropped by every handler;
+        # return before paying for stats, caller lookup and the record
+        if level < self.log_level or not self.logger.isEnabledFor(level):
+            return
+
         # Get caller info
-        frame = inspect.currentframe()
-        if frame and frame.f_back and frame.f_back.f_back:
-            caller_frame = frame.f_back.f_back
-            caller_file = os.path.basename(caller_frame.f_code.co_filename)
-            caller_func = caller_frame.f_code.co_name
+        try:
+            caller_frame = sys._getframe(2)
+        except ValueError:
+            caller_frame = None
+
+        if caller_frame is not None:
+            code = caller_frame.f_code
+            caller_path = code.co_filename
+            caller_file = self._basename_cache.get(caller_path)
+            if caller_file is None:
+                caller_file = os.path.basename(caller_path)
+                self._basename_cache[caller_path] = caller_file
+            caller_func = code.co_name
             caller_line = caller_frame.f_lineno
         else:
+            caller_path = "unknown"
             caller_file = "unknown"
             caller_func = "unknown"
             caller_line = 0
 
-        # Create log record with extra context
-        extra = {
-            'agent': agent.upper(),
-            'caller_file': caller_file,
-            'caller_func': caller_func,
-            'caller_line': caller_line,
-            **kwargs
-        }
+        agent_name = self._agent_cache.get(agent)
+        if agent_name is None:
+            agent_name = sys.intern(agent.upper())
+            self._agent_cache[agent] = agent_name
+
+        # Create log record with extra context; kwargs is a fresh dict
+        # for every call, so it is filled in place instead of copied
+        extra = kwargs
+        extra['agent'] = agent_name
+        extra['caller_file'] = caller_file
+        extra['caller_func'] = caller_func
+        extra['caller_line'] = caller_line
+
+        level_name = self._LEVEL_NAMES.get(level)
+        if level_name is None:
+            level_name = logging.getLevelName(level)
+
+        # Build the record from the caller info resolved above instead of
+        # letting Logger.log walk the stack again; its creation time is
+        # shared with the error statistics entry
+        record = self.logger.makeRecord(
+            self.logger.name, level, caller_path, caller_line, message,
+            None, None, func=caller_func, extra=extra
+        )
 
         # Update statistics
         with self.stats_lock:
-            self.stats['total_messages'] += 1
-            self.stats['by_level'][logging.getLevelName(level)] += 1
-            self.stats['by_agent'][agent.upper()] += 1
+            stats = self.stats
+            stats['total_messages'] += 1
+            stats['by_level'][level_name] += 1
+            stats['by_agent'][agent_name] += 1
 
             if level >= self.ERROR:
-                self.stats['errors'].append({
-                    'timestamp': datetime.now().isoformat(),
+                stats['errors'].append({
+                    'timestamp': datetime.fromtimestamp(record.created).isoformat(),
                     'agent': agent,
                     'message': message,
-                    'level': logging.getLevelName(level)
+                    'level': level_name
                 })
 
         # Log the message
-        self.logger.log(level, message, extra=extra)
+        self.logger.handle(record)
 
     def trace(self, agent: str, message: str, **kwargs):
         """Log a TRACE level message for detailed execution flow."""
@@ -312,11 +663,12 @@ class MergerLogger:
     def get_statistics(self) -> Dict[str, Any]:
         """Get current logging statistics."""
         with self.stats_lock:
+            stats = self.stats
             return {
-                'total_messages': self.stats['total_messages'],
-                'by_level': dict(self.stats['by_level']),
-                'by_agent': dict(self.stats['by_agent']),
-                'recent_errors': self.stats['errors'][-10:]  # Last 10 errors
+                'total_messages': stats['total_messages'],
+                'by_level': dict(stats['by_level']),
+                'by_agent': dict(stats['by_agent']),
+                'recent_errors': list(stats['errors'])[-10:]  # Last 10 errors
             }
 
     def print_statistics(self):
@@ -350,17 +702,29 @@ class MergerLogger:
                 'total_messages': 0,
                 'by_level': Counter(),
                 'by_agent': Counter(),
-                'errors': []
+                'errors': deque(maxlen=100),
+                'commands': deque(maxlen=100)
             }
 
     def set_level(self, level: int):
         """Change the logging level dynamically."""
         self.log_level = level
+        self.log_file_handler.setLevel(level)
         for handler in self.logger.handlers:
             handler.setLevel(level)
 
         self.info("SYSTEM", f"Log level changed to {logging.getLevelName(level)}")
 
+    @property
+    def is_trace_enabled(self) -> bool:
+        """
+        Whether TRACE messages are currently recorded.
+
+        Check this before trace calls in hot loops to skip building the
+        message and its context when TRACE is filtered out.
+        """
+        return self.log_level <= self.TRACE and self.logger.isEnabledFor(self.TRACE)
+
     def log_command(self, command: Union[str, List[str]], agent: str = "CLI",
                    stdout: Optional[str] = None, stderr: Optional[str] = None,
                    exit_code: Optional[int] = None, duration: Optional[float] = None,
@@ -388,26 +752,30 @@ class MergerLogger:
 
         # Parse command for tool and operation
         tool, operation = self._parse_command(command_str)
+        tool = sys.intern(tool)
+        operation = sys.intern(operation)
 
         # Update command statistics
         with self.command_stats_lock:
-            self.command_stats['total_commands'] += 1
-            self.command_stats['by_tool'][tool] += 1
-            self.command_stats['by_operation'][operation] += 1
+            command_stats = self.command_stats
+            command_stats['total_commands'] += 1
+            command_stats['by_tool'][tool] += 1
+            command_stats['by_operation'][operation] += 1
 
             if exit_code == 0:
-                self.command_stats['successful'] += 1
+                command_stats['successful'] += 1
             else:
-                self.command_stats['failed'] += 1
+                command_stats['failed'] += 1
 
             if duration:
-                self.command_stats['total_duration'] += duration
+                command_stats['total_duration'] += duration
 
             if error:
                 error_type = type(error).__name__
-                self.command_stats['errors_by_type'][error_type] += 1
+                command_stats['errors_by_type'][error_type] += 1
 
-        # Create command log entry
+        # Create command log entry; CommandJsonFormatter writes it as is,
+        # timestamp included
         command_entry = {
             'timestamp': datetime.now().isoformat(),
             'agent': agent,
@@ -421,55 +789,43 @@ class MergerLogger:
 
         # Add output if present (truncate if too long)
         if stdout:
-            command_entry['stdout'] = stdout[:5000] if len(stdout) > 5000 else stdout
+            command_entry['stdout'] = stdout[:5000]
         if stderr:
-            command_entry['stderr'] = stderr[:5000] if len(stderr) > 5000 else stderr
+            command_entry['stderr'] = stderr[:5000]
         if error:
             command_entry['error'] = str(error)
             command_entry['error_type'] = type(error).__name__
 
         # Log to command logger
-        self.command_logger.info('', extra=command_entry)
+        self.command_logger.info('', extra={'_cmd': command_entry})
 
-        # Also log to main logger at COMMAND level
+        # Also log to main logger at COMMAND level; failures are always
+        # mirrored, successful commands only when mirror_to_main is set
         level = self.COMMAND
         if exit_code != 0:
             level = self.ERROR
 
-        message = f"Command executed: {masked_command}"
-        if duration:
-            message += f" (took {duration:.3f}s)"
-        if exit_code is not None:
-            message += f" [exit: {exit_code}]"
+        if self.mirror_to_main or level == self.ERROR:
+            message = f"Command executed: {masked_command}"
+            if duration:
+                message += f" (took {duration:.3f}s)"
+            if exit_code is not None:
+                message += f" [exit: {exit_code}]"
 
-        # Remove 'agent' from command_entry to avoid conflict
-        log_extra = {k: v for k, v in command_entry.items() if k != 'agent'}
-        self._log(level, agent, message, **log_extra)
+            # Remove 'agent' from command_entry to avoid conflict
+            log_extra = command_entry.copy()
+            del log_extra['agent']
+            self._log(level, agent, message, **log_extra)
 
-        # Track in stats
+        # Track in stats (the deque keeps only the last 100 commands)
         with self.stats_lock:
             self.stats['commands'].append(command_entry)
-            # Keep only last 100 commands in memory
-            if len(self.stats['commands']) > 100:
-                self.stats['commands'] = self.stats['commands'][-100:]
 
     def _mask_sensitive_data(self, command: str) -> str:
         """Mask sensitive data in commands (passwords, tokens, etc.)."""
-        # Patterns to mask
-        patterns = [
-            (r'--password[= ][\S]+', '--password=***'),
-            (r'--token[= ][\S]+', '--token=***'),
-            (r'--api-key[= ][\S]+', '--api-key=***'),
-            (r'--secret[= ][\S]+', '--secret=***'),
-            (r'password=[\S]+', 'password=***'),
-            (r'token=[\S]+', 'token=***'),
-            (r'Bearer [\S]+', 'Bearer ***'),
-        ]
-
         masked = command
-        for pattern, replacement in patterns:
-            masked = re.sub(pattern, replacement, masked, flags=re.IGNORECASE)
-
+        for pattern, replacement in _MASK_PATTERNS:
+            masked = pattern.sub(replacement, masked)
         return masked
 
     def _parse_command(self, command: str) -> Tuple[str, str]:
@@ -478,10 +834,26 @@ class MergerLogger:
         tool = "unknown"
         operation = "unknown"
 
-        parts = shlex.split(command)
-        if parts:
+        if '"' in command or "'" in command or '\\' in command:
+            # Quoting present: let shlex resolve it
+            try:
+                parts = shlex.split(command)
+            except ValueError:
+                parts = command.split()
+            tool_part = parts[0] if parts else None
+            args = iter(parts[1:])
+        else:
+            # Plain whitespace-separated command: scan arguments lazily
+            head = command.split(None, 1)
+            tool_part = head[0] if head else None
+            if len(head) > 1:
+                args = (m.group() for m in _ARG_RE.finditer(head[1]))
+            else:
+                args = iter(())
+
+        if tool_part is not None:
             # First part is usually the tool
-            tool_part = parts[0].lower()
+            tool_part = tool_part.lower()
             if 'zbx' in tool_part or 'zabbix' in tool_part:
                 tool = 'zabbix'
             elif 'topdesk' in tool_part:
@@ -492,17 +864,17 @@ class MergerLogger:
                 tool = os.path.basename(tool_part)
 
             # Try to find operation (usually second part or after flag)
-            if len(parts) > 1:
-                for i, part in enumerate(parts[1:]):
-                    if not part.startswith('-'):
-                        operation = part
-                        break
+            for part in args:
+                if not part.startswith('-'):
+                    operation = part
+                    break
 
         return tool, operation
 
     def execute_command(self, command: Union[str, List[str]], agent: str = "CLI",
                        timeout: Optional[int] = 30, cwd: Optional[str] = None,
-                       env: Optional[Dict] = None, shell: bool = False) -> Dict[str, Any]:
+                       env: Optional[Dict] = None, shell: bool = False,
+                       max_output: Optional[int] = None) -> Dict[str, Any]:
         """
         Execute a command and log its execution details.
 
@@ -513,6 +885,8 @@ class MergerLogger:
             cwd: Working directory
             env: Environment variables
             shell: Whether to use shell execution
+            max_output: Keep at most this many bytes of stdout and stderr;
+                the rest is read and discarded while the command runs
 
         Returns:
             Dictionary with command results
@@ -533,24 +907,30 @@ class MergerLogger:
             if isinstance(command, str) and not shell:
                 command = shlex.split(command)
 
-            proc = subprocess.run(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=timeout,
-                cwd=cwd,
-                env=env,
-                shell=shell,
-                text=True
-            )
+            if max_output is None:
+                proc = subprocess.run(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout,
+                    cwd=cwd,
+                    env=env,
+                    shell=shell,
+                    text=True
+                )
+                exit_code, stdout, stderr = proc.returncode, proc.stdout, proc.stderr
+            else:
+                exit_code, stdout, stderr = self._run_capped(
+                    command, max_output, timeout=timeout, cwd=cwd, env=env, shell=shell
+                )
 
             duration = time.time() - start_time
 
             result.update({
-                'success': proc.returncode == 0,
-                'exit_code': proc.returncode,
-                'stdout': proc.stdout,
-                'stderr': proc.stderr,
+                'success': exit_code == 0,
+                'exit_code': exit_code,
+                'stdout': stdout,
+                'stderr': stderr,
                 'duration': duration
             })
 
@@ -558,9 +938,9 @@ class MergerLogger:
             self.log_command(
                 command=command,
                 agent=agent,
-                stdout=proc.stdout,
-                stderr=proc.stderr,
-                exit_code=proc.returncode,
+                stdout=stdout,
+                stderr=stderr,
+                exit_code=exit_code,
                 duration=duration
             )
 
@@ -594,6 +974,78 @@ class MergerLogger:
 
         return result
 
+    @staticmethod
+    def _run_capped(command: Union[str, List[str]], max_output: int,
+                    timeout: Optional[int] = None, cwd: Optional[str] = None,
+                    env: Optional[Dict] = None,
+                    shell: bool = False) -> Tuple[int, str, str]:
+        """
+        Run a command keeping only the first max_output bytes of its output.
+
+        Both pipes are drained by reader threads so the command never blocks
+        on a full pipe, but bytes past the limit are dropped as they arrive
+        instead of being accumulated.
+
+        Args:
+            command: Command to execute
+            max_output: Maximum number of bytes kept per stream
+            timeout: Command timeout in seconds
+            cwd: Working directory
+            env: Environment variables
+            shell: Whether to use shell execution
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If the command exceeds the timeout
+        """
+        def drain(stream, chunks: List[bytes]):
+            kept = 0
+            with stream:
+                for chunk in iter(lambda: stream.read1(_PIPE_READ_SIZE), b''):
+                    if kept < max_output:
+                        chunk = chunk[:max_output - kept]
+                        chunks.append(chunk)
+                        kept += len(chunk)
+
+        proc = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            shell=shell
+        )
+        stdout_chunks: List[bytes] = []
+        stderr_chunks: List[bytes] = []
+        readers = [
+            threading.Thread(target=drain, args=(proc.stdout, stdout_chunks), daemon=True),
+            threading.Thread(target=drain, args=(proc.stderr, stderr_chunks), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            # A child of the command may still hold the pipes open, so only
+            # give the readers a moment instead of waiting for EOF
+            for reader in readers:
+                reader.join(_READER_JOIN_TIMEOUT)
+            raise
+
+        for reader in readers:
+            reader.join()
+
+        return (
+            proc.returncode,
+            b''.join(stdout_chunks).decode('utf-8', errors='replace'),
+            b''.join(stderr_chunks).decode('utf-8', errors='replace')
+        )
+
     def replay_commands(self, filter_tool: Optional[str] = None,
                        filter_success: Optional[bool] = None,
                        last_n: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -614,23 +1066,39 @@ class MergerLogger:
         if not command_log_path.exists():
             return commands
 
-        with open(command_log_path, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
+        # Make sure commands still queued for the listener are on disk
+        self.flush()
 
-                    # Apply filters
-                    if filter_tool and entry.get('tool') != filter_tool:
-                        continue
-                    if filter_success is not None and entry.get('success') != filter_success:
-                        continue
+        def matches(entry: Dict[str, Any]) -> bool:
+            if filter_tool and entry.get('tool') != filter_tool:
+                return False
+            if filter_success is not None and entry.get('success') != filter_success:
+                return False
+            return True
 
+        if last_n:
+            # Scan from the end and stop once enough entries matched
+            for line in _iter_lines_reverse(command_log_path):
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    continue
+                if matches(entry):
                     commands.append(entry)
-                except json.JSONDecodeError:
+                    if len(commands) == last_n:
+                        break
+            commands.reverse()
+            return commands
+
+        with open(command_log_path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _loads(line)
+                except ValueError:
                     continue
+                if matches(entry):
+                    commands.append(entry)
 
-        if last_n:
-            return commands[-last_n:]
         return commands
 
     def get_failed_commands(self, last_n: Optional[int] = 10) -> List[Dict[str, Any]]:
@@ -695,13 +1163,83 @@ class MergerLogger:
         print("=" * 50 + "\n")
 
 
+# Register the custom log levels once, when the module is imported
+logging.addLevelName(MergerLogger.TRACE, "TRACE")
+logging.addLevelName(MergerLogger.COMMAND, "COMMAND")
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that coalesces writes in a large buffer.
+
+    Records below WARNING stay in the buffer until it fills up or the
+    periodic flush runs; WARNING and above are flushed immediately so
+    problems reach the disk without delay.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
+                 encoding=None, delay=False, errors=None,
+                 buffer_size: int = 64 * 1024, flush_interval: float = 1.0):
+        """
+        Initialize the handler.
+
+        Args:
+            buffer_size: Size of the write buffer in bytes
+            flush_interval: Seconds between periodic flushes
+            (remaining arguments as for RotatingFileHandler)
+        """
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode=mode, maxBytes=maxBytes,
+                         backupCount=backupCount, encoding=encoding,
+                         delay=delay, errors=errors)
+
+        self.flush_interval = flush_interval
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically,
+                                         name='merger-log-flush', daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        """Write a record, flushing only for WARNING and above."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_periodically(self):
+        """Flush buffered records every flush_interval seconds."""
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Stop the periodic flush and close the file."""
+        self._closing.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+        super().close()
+
+
 class JsonFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
     def format(self, record):
         """Format log record as JSON."""
         log_obj = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created),
             'level': record.levelname,
             'agent': getattr(record, 'agent', 'UNKNOWN'),
             'message': record.getMessage(),
@@ -712,12 +1250,7 @@ class JsonFormatter(logging.Formatter):
 
         # Add any extra fields
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename',
-                          'funcName', 'levelname', 'levelno', 'lineno', 'module',
-                          'msecs', 'message', 'pathname', 'process', 'processName',
-                          'relativeCreated', 'thread', 'threadName', 'agent',
-                          'caller_file', 'caller_func', 'caller_line', 'exc_info',
-                          'exc_text', 'stack_info']:
+            if key not in _RESERVED_RECORD_ATTRS:
                 log_obj[key] = value
 
         # Add exception info if present
@@ -728,7 +1261,7 @@ class JsonFormatter(logging.Formatter):
                 'traceback': traceback.format_exception(*record.exc_info)
             }
 
-        return json.dumps(log_obj)
+        return _dumps(log_obj)
 
 
 class CommandJsonFormatter(logging.Formatter):
@@ -736,7 +1269,12 @@ class CommandJsonFormatter(logging.Formatter):
 
     def format(self, record):
         """Format command log record as JSON."""
-        # Extract all the command-specific fields from extra
+        # MergerLogger.log_command passes the finished entry as one attribute
+        command_obj = getattr(record, '_cmd', None)
+        if command_obj is not None:
+            return _dumps(command_obj)
+
+        # Otherwise extract the command-specific fields from extra
         command_obj = {}
         for key in ['timestamp', 'agent', 'command', 'tool', 'operation',
                    'exit_code', 'duration', 'success', 'stdout', 'stderr',
@@ -746,9 +1284,9 @@ class CommandJsonFormatter(logging.Formatter):
 
         # If no timestamp in extra, add it
         if 'timestamp' not in command_obj:
-            command_obj['timestamp'] = datetime.fromtimestamp(record.created).isoformat()
+            command_obj['timestamp'] = datetime.fromtimestamp(record.created)
 
-        return json.dumps(command_obj)
+        return _dumps(command_obj)
 
 
 class LogAnalyzer:
@@ -765,18 +1303,37 @@ class LogAnalyzer:
         if not self.log_path.exists():
             raise FileNotFoundError(f"Log file not found: {log_path}")
 
+        # Error entries from the last full scan, keyed by the file's
+        # (size, mtime) so get_errors can skip rescanning an unchanged log
+        self._errors_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+
+    @staticmethod
+    def _file_key(f) -> Tuple[int, int]:
+        """Identify the current contents of an open file by size and mtime."""
+        st = os.fstat(f.fileno())
+        return (st.st_size, st.st_mtime_ns)
+
+    @staticmethod
+    def _error_entry(line_num: int, parsed: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a get_errors entry from a parsed log line."""
+        return {
+            'line_number': line_num,
+            'timestamp': parsed.get('timestamp'),
+            'agent': parsed.get('agent'),
+            'message': parsed.get('message'),
+            'level': parsed.get('level')
+        }
+
     def parse_log_line(self, line: str) -> Optional[Dict[str, Any]]:
         """Parse a single log line."""
         # Try JSON format first
         try:
-            return json.loads(line)
-        except json.JSONDecodeError:
+            return _loads(line)
+        except ValueError:
             pass
 
         # Try text format
-        import re
-        pattern = r'\[([\d-]+\s[\d:]+\.[\d]+)\]\s+\[(\w+)\]\s+\[(\w+)\]\s+(.*)'
-        match = re.match(pattern, line)
+        match = _TEXT_LINE_RE.match(line)
         if match:
             return {
                 'timestamp': match.group(1),
@@ -787,6 +1344,39 @@ class LogAnalyzer:
 
         return None
 
+    def _parse_log_bytes(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """Parse a single raw log line read from the mapped log file."""
+        # JSON entries are objects and text entries open with '[', so the
+        # first byte picks the one parser that can succeed; anything else
+        # (tracebacks, continuation lines) is skipped without parsing
+        first = line[:1]
+        if first.isspace():
+            line = line.lstrip()
+            first = line[:1]
+        if first == b'{':
+            try:
+                parsed = _loads(line)
+            except ValueError:
+                return None
+            return parsed if isinstance(parsed, dict) else None
+        if first != b'[':
+            return None
+
+        # Try text format
+        match = _TEXT_LINE_BYTES_RE.match(line)
+        if match:
+            timestamp, level, agent, message = (
+                group.decode('utf-8', errors='replace') for group in match.groups()
+            )
+            return {
+                'timestamp': timestamp,
+                'level': level,
+                'agent': agent,
+                'message': message
+            }
+
+        return None
+
     def analyze(self,
                 start_time: Optional[datetime] = None,
                 end_time: Optional[datetime] = None,
@@ -802,7 +1392,7 @@ class LogAnalyzer:
             agent_filter: Only include logs from this agent
 
         Returns:
-            Analysis results
+            Analysis results; 'errors' and 'warnings' hold LogEntry tuples
         """
         results = {
             'total_lines': 0,
@@ -814,76 +1404,94 @@ class LogAnalyzer:
             'timeline': defaultdict(int)
         }
 
-        with open(self.log_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                results['total_lines'] += 1
+        # Timestamp prefix -> hour bucket; consecutive lines mostly share
+        # the hour, so each hour is parsed and formatted only once
+        hour_buckets: Dict[str, str] = {}
+
+        # Map the file and walk its raw lines; JSON lines are decoded from
+        # bytes directly and text lines only decode the matched groups
+        # The same pass also collects the unfiltered error entries that
+        # get_errors returns, so it does not have to read the file again
+        error_entries = []
+        with open(self.log_path, 'rb') as f:
+            file_key = self._file_key(f)
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                self._errors_cache = (file_key, error_entries)
+                return results
+
+            with mm:
+                for line_num, line in enumerate(iter(mm.readline, b''), 1):
+                    results['total_lines'] += 1
+
+                    parsed = self._parse_log_bytes(line.rstrip(b'\n'))
+                    if not parsed:
+                        continue
 
-                parsed = self.parse_log_line(line.strip())
-                if not parsed:
-                    continue
+                    results['parsed_lines'] += 1
 
-                results['parsed_lines'] += 1
+                    if parsed.get('level') in _ERROR_LEVELS:
+                        error_entries.append(self._error_entry(line_num, parsed))
 
-                # Apply filters
-                if level_filter and parsed.get('level') != level_filter:
-                    continue
-                if agent_filter and parsed.get('agent') != agent_filter:
-                    continue
+                    # Apply filters
+                    if level_filter and parsed.get('level') != level_filter:
+                        continue
+                    if agent_filter and parsed.get('agent') != agent_filter:
+                        continue
 
-                # Time filtering
-                if start_time or end_time:
-                    try:
-                        if 'timestamp' in parsed:
-                            if isinstance(parsed['timestamp'], str):
-                                log_time = datetime.fromisoformat(
-                                    parsed['timestamp'].replace(' ', 'T')
-                                )
-                            else:
-                                log_time = datetime.fromtimestamp(parsed['timestamp'])
-
-                            if start_time and log_time < start_time:
-                                continue
-                            if end_time and log_time > end_time:
-                                continue
-                    except:
-                        pass
-
-                # Collect statistics
-                level = parsed.get('level', 'UNKNOWN')
-                agent = parsed.get('agent', 'UNKNOWN')
-
-                results['by_level'][level] += 1
-                results['by_agent'][agent] += 1
-
-                # Collect errors and warnings
-                if level == 'ERROR':
-                    results['errors'].append({
-                        'line': line_num,
-                        'agent': agent,
-                        'message': parsed.get('message', '')
-                    })
-                elif level == 'WARNING':
-                    results['warnings'].append({
-                        'line': line_num,
-                        'agent': agent,
-                        'message': parsed.get('message', '')
-                    })
-
-                # Timeline analysis (hourly buckets)
-                try:
-                    if 'timestamp' in parsed:
-                        if isinstance(parsed['timestamp'], str):
-                            log_time = datetime.fromisoformat(
-                                parsed['timestamp'].replace(' ', 'T')
-                            )
-                        else:
-                            log_time = datetime.fromtimestamp(parsed['timestamp'])
-
-                        hour_bucket = log_time.strftime('%Y-%m-%d %H:00')
+                    # Time filtering; entries without a usable timestamp,
+                    # or one not comparable with the bounds, are kept
+                    if start_time or end_time:
+                        log_time = _to_datetime(parsed.get('timestamp'))
+                        if log_time is not None:
+                            try:
+                                if start_time and log_time < start_time:
+                                    continue
+                                if end_time and log_time > end_time:
+                                    continue
+                            except TypeError:
+                                pass
+
+                    # Collect statistics
+                    level = parsed.get('level', 'UNKNOWN')
+                    agent = parsed.get('agent', 'UNKNOWN')
+
+                    results['by_level'][level] += 1
+                    results['by_agent'][agent] += 1
+
+                    # Collect errors and warnings
+                    if level == 'ERROR':
+                        results['errors'].append(
+                            LogEntry(line_num, agent, parsed.get('message', ''))
+                        )
+                    elif level == 'WARNING':
+                        results['warnings'].append(
+                            LogEntry(line_num, agent, parsed.get('message', ''))
+                        )
+
+                    # Timeline analysis (hourly buckets)
+                    timestamp = parsed.get('timestamp')
+                    if isinstance(timestamp, str):
+                        # The first 13 characters of an ISO timestamp fix
+                        # its date and hour
+                        prefix = timestamp[:13]
+                        hour_bucket = hour_buckets.get(prefix)
+                        if hour_bucket is None:
+                            log_time = _to_datetime(timestamp)
+                            if log_time is not None:
+                                hour_bucket = log_time.strftime('%Y-%m-%d %H:00')
+                                hour_buckets[prefix] = hour_bucket
+                    else:
+                        log_time = _to_datetime(timestamp)
+                        hour_bucket = (log_time.strftime('%Y-%m-%d %H:00')
+                                       if log_time is not None else None)
+
+                    if hour_bucket is not None:
                         results['timeline'][hour_bucket] += 1
-                except:
-                    pass
 
+        self._errors_cache = (file_key, error_entries)
         return results
 
     def search(self, pattern: str, context_lines: int = 0) -> List[Tuple[int, str]]:
@@ -895,52 +1503,189 @@ class LogAnalyzer:
             context_lines: Number of context lines before/after match
 
         Returns:
-            List of (line_number, line_content) tuples
+            List of (line_number, line_content) tuples, each line at most once
         """
-        import re
-        regex = re.compile(pattern, re.IGNORECASE)
+        regex = _user_regex(pattern)
+        hint = _literal_hint(pattern)
+        context_lines = max(context_lines, 0)
+
+        # Plain single-line literals are located in the mapped file with a
+        # bytes regex instead of decoding and testing every line
+        if hint is not None and pattern.isprintable():
+            return self._search_mapped(regex, hint, context_lines)
+
         matches = []
 
+        # Lines not yet emitted that may precede the next match, and the
+        # number of lines still owed after the last match
+        before = deque(maxlen=context_lines)
+        after = 0
+
         with open(self.log_path, 'r') as f:
-            lines = f.readlines()
+            for line_num, line in enumerate(f, 1):
+                if ((hint is None or _may_contain(line, hint))
+                        and regex.search(line)):
+                    matches.extend(before)
+                    before.clear()
+                    matches.append((line_num, line.rstrip()))
+                    after = context_lines
+                elif after:
+                    matches.append((line_num, line.rstrip()))
+                    after -= 1
+                elif context_lines:
+                    before.append((line_num, line.rstrip()))
+
+        return matches
+
+    def _search_mapped(self, regex: re.Pattern, hint: str,
+                       context_lines: int) -> List[Tuple[int, str]]:
+        """
+        Search a memory-mapped log for a literal pattern.
 
-        for i, line in enumerate(lines):
-            if regex.search(line):
-                # Add context lines
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
+        Candidate lines are found with C-level scans over lower-cased blocks
+        of the mapped bytes: occurrences of the literal, plus any line
+        holding non-ASCII bytes (where str case folding can match more).
+        Only those lines are decoded and confirmed with the str regex.
 
-                for j in range(start, end):
-                    matches.append((j + 1, lines[j].rstrip()))
+        Args:
+            regex: Compiled case-insensitive search pattern
+            hint: The pattern as a lower-cased ASCII literal
+            context_lines: Number of context lines before/after match
+
+        Returns:
+            List of (line_number, line_content) tuples, each line at most once
+        """
+        matches = []
+
+        with open(self.log_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return matches
+
+            with mm:
+                size = len(mm)
+
+                def line_end(start: int) -> int:
+                    end = mm.find(b'\n', start)
+                    return size if end == -1 else end
+
+                def line_text(start: int, end: int) -> str:
+                    return mm[start:end].decode('utf-8', errors='replace').rstrip()
+
+                # Matching lines as (line_number, start, end) byte spans
+                hits = []
+                needle = hint.encode('ascii')
+                block_line = 1  # line number at the start of the block
+                checked_until = 0
+                for block_start in range(0, size, _SEARCH_BLOCK_SIZE):
+                    # Overlap the next block so occurrences straddling the
+                    # boundary are found; they are reported by this block
+                    block = mm[block_start:block_start + _SEARCH_BLOCK_SIZE + len(needle) - 1]
+                    limit = min(_SEARCH_BLOCK_SIZE, size - block_start)
+
+                    positions = []
+                    lowered = block.lower()
+                    pos = lowered.find(needle)
+                    while pos != -1 and pos < limit:
+                        positions.append(pos)
+                        pos = lowered.find(needle, pos + 1)
+                    if not block.isascii():
+                        positions = sorted(positions + [
+                            m.start() for m in _NON_ASCII_RE.finditer(block, 0, limit)
+                        ])
+
+                    line_num = block_line
+                    counted = 0
+                    for pos in positions:
+                        line_num += block.count(b'\n', counted, pos)
+                        counted = pos
+                        pos += block_start
+                        if pos < checked_until:
+                            continue
+                        start = mm.rfind(b'\n', 0, pos) + 1
+                        end = line_end(pos)
+                        checked_until = end + 1
+                        if regex.search(line_text(start, end)):
+                            hits.append((line_num, start, end))
+                    block_line += block.count(b'\n', 0, limit)
+
+                # Emit each hit with its context, merging overlapping windows
+                emitted = 0
+                i = 0
+                while i < len(hits):
+                    line_num, start, end = hits[i]
+                    i += 1
+
+                    before = []
+                    pos = start
+                    for _ in range(line_num - max(line_num - context_lines, emitted + 1)):
+                        prev_start = mm.rfind(b'\n', 0, pos - 1) + 1
+                        before.append(line_text(prev_start, pos - 1))
+                        pos = prev_start
+                    first = line_num - len(before)
+                    matches.extend(zip(range(first, line_num), reversed(before)))
+                    matches.append((line_num, line_text(start, end)))
+
+                    window_end = line_num + context_lines
+                    while line_num < window_end and end + 1 < size:
+                        start = end + 1
+                        end = line_end(start)
+                        line_num += 1
+                        matches.append((line_num, line_text(start, end)))
+                        if i < len(hits) and hits[i][0] == line_num:
+                            window_end = line_num + context_lines
+                            i += 1
+                    emitted = line_num
 
         return matches
 
     def tail(self, n: int = 50) -> List[str]:
         """Get the last n lines from the log file."""
-        with open(self.log_path, 'r') as f:
-            lines = f.readlines()
-
-        return [line.rstrip() for line in lines[-n:]]
+        if n <= 0:
+            with open(self.log_path, 'r') as f:
+                lines = f.readlines()
+            return [line.rstrip() for line in lines[-n:]]
+
+        # Read backwards so only the tail of the file is touched
+        lines = []
+        reverse_lines = _iter_lines_reverse(self.log_path)
+        last = next(reverse_lines)
+        # A trailing newline does not start another line
+        if last:
+            lines.append(last.rstrip())
+        for line in reverse_lines:
+            if len(lines) == n:
+                break
+            lines.append(line.rstrip())
+        lines.reverse()
+        return lines
 
     def get_errors(self, last_n: Optional[int] = None) -> List[Dict[str, Any]]:
         """Extract error entries from the log."""
-        errors = []
-
         with open(self.log_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                parsed = self.parse_log_line(line.strip())
-                if parsed and parsed.get('level') in ['ERROR', 'CRITICAL']:
-                    errors.append({
-                        'line_number': line_num,
-                        'timestamp': parsed.get('timestamp'),
-                        'agent': parsed.get('agent'),
-                        'message': parsed.get('message'),
-                        'level': parsed.get('level')
-                    })
+            file_key = self._file_key(f)
+
+            # Reuse the entries from analyze() or an earlier call if the
+            # file has not changed since
+            if self._errors_cache is not None and self._errors_cache[0] == file_key:
+                errors = self._errors_cache[1]
+            else:
+                errors = []
+                for line_num, line in enumerate(f, 1):
+                    # An error entry carries its level name verbatim in both
+                    # the text and JSON formats; skip parsing other lines
+                    if 'ERROR' not in line and 'CRITICAL' not in line:
+                        continue
+                    parsed = self.parse_log_line(line.rstrip('\n'))
+                    if parsed and parsed.get('level') in _ERROR_LEVELS:
+                        errors.append(self._error_entry(line_num, parsed))
+                self._errors_cache = (file_key, errors)
 
         if last_n:
             return errors[-last_n:]
-        return errors
+        return list(errors)
 
     def analyze_commands(self, command_log_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -968,15 +1713,21 @@ class LogAnalyzer:
             'failed': 0,
             'by_tool': Counter(),
             'by_operation': Counter(),
-            'errors': [],
+            'errors': deque(maxlen=20),
             'slow_commands': [],  # Commands taking > 5s
-            'recent_failures': []
+            'recent_failures': deque(maxlen=10)
         }
 
-        with open(log_path, 'r') as f:
+        # Ten slowest commands as a min-heap of (duration, -seq, entry);
+        # the sequence number keeps earlier commands ahead on ties
+        slow_heap = []
+
+        # Raw lines go straight to the JSON decoder (orjson when available),
+        # which accepts bytes and surrounding whitespace
+        with open(log_path, 'rb') as f:
             for line in f:
                 try:
-                    cmd = json.loads(line.strip())
+                    cmd = _loads(line)
                     results['total_commands'] += 1
 
                     # Count success/failure
@@ -995,13 +1746,17 @@ class LogAnalyzer:
                     results['by_operation'][cmd.get('operation', 'unknown')] += 1
 
                     # Find slow commands
-                    duration = cmd.get('duration', 0)
+                    duration = cmd.get('duration') or 0
                     if duration > 5.0:
-                        results['slow_commands'].append({
+                        slow = (duration, -results['total_commands'], {
                             'command': cmd.get('command'),
                             'duration': duration,
                             'timestamp': cmd.get('timestamp')
                         })
+                        if len(slow_heap) < 10:
+                            heapq.heappush(slow_heap, slow)
+                        elif slow[:2] > slow_heap[0][:2]:
+                            heapq.heapreplace(slow_heap, slow)
 
                     # Collect errors
                     if cmd.get('error'):
@@ -1012,7 +1767,7 @@ class LogAnalyzer:
                             'timestamp': cmd.get('timestamp')
                         })
 
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
 
         # Calculate success rate
@@ -1021,12 +1776,12 @@ class LogAnalyzer:
         else:
             results['success_rate'] = 0
 
-        # Keep only recent items
-        results['recent_failures'] = results['recent_failures'][-10:]
-        results['slow_commands'] = sorted(results['slow_commands'],
-                                         key=lambda x: x['duration'],
-                                         reverse=True)[:10]
-        results['errors'] = results['errors'][-20:]
+        # Recent items were bounded during the scan
+        results['recent_failures'] = list(results['recent_failures'])
+        results['slow_commands'] = [
+            entry for _, _, entry in sorted(slow_heap, key=lambda item: item[:2], reverse=True)
+        ]
+        results['errors'] = list(results['errors'])
 
         return results
 
@@ -1045,15 +1800,16 @@ class LogAnalyzer:
             List of matching log lines
         """
         matches = []
-        command_pattern = re.compile(r'Command executed:', re.IGNORECASE)
+        command_pattern = _COMMAND_RE
 
         if pattern:
-            user_pattern = re.compile(pattern, re.IGNORECASE)
+            user_pattern = _user_regex(pattern)
 
         with open(self.log_path, 'r') as f:
             for line in f:
-                # Check if it's a command log line
-                if command_pattern.search(line):
+                # Check if it's a command log line (substring test first)
+                if (_may_contain(line, 'command executed:')
+                        and command_pattern.search(line)):
                     # Apply filters
                     if tool and tool.lower() not in line.lower():
                         continue
@@ -1107,5 +1863,6 @@ def setup_logger(config: Dict[str, Any]) -> MergerLogger:
         backup_count=logger_config.get('backup_count', 5),
         log_level=getattr(logging, logger_config.get('level', 'INFO')),
         console_output=logger_config.get('console_output', True),
-        json_format=logger_config.get('json_format', False)
+        json_format=logger_config.get('json_format', False),
+        mirror_to_main=logger_config.get('mirror_commands', True)
     )
@@ -4,14 +4,23 @@ Integration examples showing how to use the logger in merger tool agents.
 This file demonstrates best practices for integrating the logger.
 """
 
+import re
 import time
 from typing import Dict, List, Any, Optional
 from logger import get_logger, MergerLogger
 
+# Fields every record must carry a non-empty value for, in report order
+_REQUIRED_FIELDS = ('id', 'name', 'asset_id')
+
+# Dotted-quad shape used by ValidatorAgent._validate_ip
+_IP_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+
 
 class DataFetcherAgent:
     """Example integration for DataFetcher agent."""
     
+    __slots__ = ('logger', 'agent_name')
+    
     def __init__(self, logger: MergerLogger):
         self.logger = logger
         self.agent_name = "DATAFETCHER"
@@ -51,6 +60,8 @@ class DataFetcherAgent:
 class DifferAgent:
     """Example integration for Differ agent."""
     
+    __slots__ = ('logger', 'agent_name')
+    
     def __init__(self, logger: MergerLogger):
         self.logger = logger
         self.agent_name = "DIFFER"
@@ -68,17 +79,21 @@ class DifferAgent:
         processed = 0
         not_found = 0
         
+        # Index Topdesk assets by id once so each lookup is O(1)
+        topdesk_index = {t_asset.get('id'): t_asset for t_asset in topdesk_assets}
+        
         for z_asset in zabbix_assets:
             asset_id = z_asset.get('id')
             
-            self.logger.trace(
-                self.agent_name,
-                f"Comparing asset {asset_id}",
-                asset_id=asset_id
-            )
+            if self.logger.is_trace_enabled:
+                self.logger.trace(
+                    self.agent_name,
+                    f"Comparing asset {asset_id}",
+                    asset_id=asset_id
+                )
             
             # Find corresponding Topdesk asset
-            t_asset = self._find_topdesk_asset(asset_id, topdesk_assets)
+            t_asset = self._find_topdesk_asset(asset_id, topdesk_index)
             
             if not t_asset:
                 self.logger.warning(
@@ -113,10 +128,9 @@ class DifferAgent:
         
         return differences
     
-    def _find_topdesk_asset(self, asset_id: str, topdesk_assets: List) -> Optional[Dict]:
-        """Helper method to find asset in Topdesk list."""
-        # Implementation here
-        return None
+    def _find_topdesk_asset(self, asset_id: str, topdesk_index: Dict) -> Optional[Dict]:
+        """Helper method to find asset in the Topdesk id index."""
+        return topdesk_index.get(asset_id)
     
     def _compare_fields(self, z_asset: Dict, t_asset: Dict) -> List:
         """Helper method to compare asset fields."""
@@ -127,6 +141,8 @@ class DifferAgent:
 class ApplierAgent:
     """Example integration for Applier agent."""
     
+    __slots__ = ('logger', 'agent_name')
+    
     def __init__(self, logger: MergerLogger):
         self.logger = logger
         self.agent_name = "APPLIER"
@@ -146,12 +162,13 @@ class ApplierAgent:
             asset_id = change.get('asset_id')
             
             try:
-                self.logger.trace(
-                    self.agent_name,
-                    f"Applying change to asset",
-                    asset_id=asset_id,
-                    change_type=change.get('type')
-                )
+                if self.logger.is_trace_enabled:
+                    self.logger.trace(
+                        self.agent_name,
+                        f"Applying change to asset",
+                        asset_id=asset_id,
+                        change_type=change.get('type')
+                    )
                 
                 # ... actual change application ...
                 
@@ -202,6 +219,8 @@ class ApplierAgent:
 class TUIOperatorAgent:
     """Example integration for TUI Operator agent."""
     
+    __slots__ = ('logger', 'agent_name', 'session_start')
+    
     def __init__(self, logger: MergerLogger):
         self.logger = logger
         self.agent_name = "TUIOPERATOR"
@@ -256,6 +275,8 @@ class TUIOperatorAgent:
 class ValidatorAgent:
     """Example integration for Validator agent."""
     
+    __slots__ = ('logger', 'agent_name')
+    
     def __init__(self, logger: MergerLogger):
         self.logger = logger
         self.agent_name = "VALIDATOR"
@@ -278,25 +299,26 @@ class ValidatorAgent:
         for record in data:
             record_id = record.get('id', 'unknown')
             
-            self.logger.trace(
-                self.agent_name,
-                f"Validating record",
-                record_id=record_id
-            )
+            if self.logger.is_trace_enabled:
+                self.logger.trace(
+                    self.agent_name,
+                    f"Validating record",
+                    record_id=record_id
+                )
             
-            # Validate required fields
-            for field in ['id', 'name', 'asset_id']:
-                if field not in record or not record[field]:
-                    self.logger.warning(
-                        self.agent_name,
-                        f"Missing required field",
-                        record_id=record_id,
-                        field=field
-                    )
-                    validation_results["warnings"].append({
-                        "record": record_id,
-                        "issue": f"Missing field: {field}"
-                    })
+            # Validate required fields (absent or empty), one warning per record
+            missing = [field for field in _REQUIRED_FIELDS if not record.get(field)]
+            if missing:
+                self.logger.warning(
+                    self.agent_name,
+                    f"Missing required fields",
+                    record_id=record_id,
+                    fields=missing
+                )
+                validation_results["warnings"].extend(
+                    {"record": record_id, "issue": f"Missing field: {field}"}
+                    for field in missing
+                )
             
             # Validate data types and formats
             if 'ip_address' in record:
@@ -333,9 +355,7 @@ class ValidatorAgent:
     def _validate_ip(self, ip: str) -> bool:
         """Helper to validate IP address format."""
         # Simple validation example
-        import re
-        pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        return bool(re.match(pattern, str(ip)))
+        return _IP_RE.match(str(ip)) is not None
 
 
 # Example usage function
@@ -5,12 +5,157 @@ Ensures consistent and reproducible ordering of all data structures.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Union, Callable
-from functools import cmp_to_key
+import json
+import heapq
+import operator
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable
+from functools import lru_cache
+from dataclasses import dataclass, asdict, fields
 import logging
 
+from json_codec import decode_json
+
 logger = logging.getLogger(__name__)
 
+# Splits text into alternating non-digit and digit runs for natural sorting
+_SPLIT_NUMBERS = re.compile(r'(\d+)').split
+
+# Matches the common single prefix + number asset ID shape (srv10, web-3)
+_PREFIX_NUMBER = re.compile(r'(\D+)(\d+)').fullmatch
+
+# Number of natural sort keys kept in the _nskey cache
+_NSKEY_CACHE_SIZE = 4096
+
+
+def _natural_key(text: Any) -> tuple:
+    """
+    Natural sort key, as a tuple.
+
+    Same ordering as SortingStrategy.natural_sort_key.
+
+    Args:
+        text: Value to generate sort key for
+
+    Returns:
+        Tuple of mixed int/str for sorting
+    """
+    if text is None:
+        return (float('inf'), '')  # Null values sort to end
+
+    # Handle special characters and normalize
+    text = str(text).strip().lower()
+
+    # Split into numeric and non-numeric parts
+    # (the compiled split beat a hand-written character scanner on
+    # typical asset IDs, so it stays the tokenizer)
+    parts = tuple([int(part) if part.isdigit() else part
+                   for part in _SPLIT_NUMBERS(text) if part])
+
+    return parts if parts else ('',)
+
+
+# Natural sort keys of recently seen hashable values
+_cached_natural_key = lru_cache(maxsize=_NSKEY_CACHE_SIZE, typed=True)(_natural_key)
+
+
+def _nskey(text: Any) -> tuple:
+    """
+    Cached natural sort key used by the sorting hot paths.
+
+    Repeated asset IDs across sort and validation passes reuse one key.
+    Unhashable values (lists, dicts) cannot be cached and get their key
+    computed directly.
+
+    Args:
+        text: Value to generate sort key for
+
+    Returns:
+        Tuple of mixed int/str for sorting
+    """
+    try:
+        return _cached_natural_key(text)
+    except TypeError:
+        return _natural_key(text)
+
+
+def _prefix_number_keys(asset_ids: List[Any]) -> Optional[List[tuple]]:
+    """
+    Build asset sort keys in bulk when every ID is prefix + number.
+
+    The keys order exactly like the ones sort_assets derives through
+    _nskey, but come from a single match per ID. Gives up on the first
+    ID of another shape so the caller can fall back to the general path.
+
+    Args:
+        asset_ids: Non-empty asset_id value of each asset, in list order
+
+    Returns:
+        List of sort keys, or None if an ID does not fit the shape
+    """
+    keys = []
+    append = keys.append
+    for asset_id in asset_ids:
+        if not isinstance(asset_id, str):
+            return None
+        match = _PREFIX_NUMBER(asset_id.strip().lower())
+        if match is None:
+            return None
+        append((match[1], int(match[2])))
+    return keys
+
+
+def _asset_sort_key(asset: Dict[str, Any]) -> tuple:
+    """Generate sort key for assets; empty IDs sort to end."""
+    # A leading 0/1 flag puts empty IDs last without a branch per
+    # comparison; flat (flag, *natural key) tuples compare without
+    # descending into a nested tuple
+    asset_id = asset.get('asset_id', '')
+    if not asset_id:
+        return (1,)
+    return (0,) + _nskey(asset_id)
+
+
+# Dif operation order (add < modify < delete); unknown operations sort last
+_OP_ORDER = {'add': 1, 'modify': 2, 'delete': 3}
+_OP_GET = _OP_ORDER.get
+
+# Apl defaults that sort entries without a timestamp or sequence last
+_NO_TIMESTAMP = '9999-99-99'
+_NO_SEQUENCE = 999999
+
+
+def _dif_sort_key(entry: Dict[str, Any]) -> tuple:
+    """Generate sort key for dif entries."""
+    get = entry.get
+    # asset_id, then operation type, then field name
+    return (
+        _nskey(get('asset_id', '')),
+        _OP_GET(get('operation', 'modify'), 99),
+        get('field', '').lower()
+    )
+
+
+def _apl_sort_key(entry: Dict[str, Any]) -> tuple:
+    """Generate sort key for apl entries."""
+    get = entry.get
+    # timestamp (if present), then asset_id, then sequence number
+    return (
+        get('timestamp', _NO_TIMESTAMP),
+        _nskey(get('asset_id', '')),
+        get('sequence', _NO_SEQUENCE)
+    )
+
+
+def _encode_document(data: Any) -> bytes:
+    """
+    Encode a .dif/.apl document with two-space indentation.
+
+    Always uses the json module so the written bytes do not depend on
+    whether orjson is installed (orjson would emit raw UTF-8 and its own
+    float formatting).
+    """
+    return json.dumps(data, indent=2, sort_keys=False).encode()
+
 
 class SortingStrategy:
     """
@@ -48,21 +193,7 @@ class SortingStrategy:
         Returns:
             List of mixed int/str for sorting
         """
-        if text is None:
-            return [float('inf'), '']  # Null values sort to end
-
-        # Handle special characters and normalize
-        text = str(text).strip().lower()
-
-        # Split into numeric and non-numeric parts
-        parts = []
-        for part in re.split(r'(\d+)', text):
-            if part.isdigit():
-                parts.append(int(part))
-            elif part:
-                parts.append(part)
-
-        return parts if parts else ['']
+        return list(_nskey(text))
 
     @staticmethod
     def asset_id_comparator(a: Dict[str, Any], b: Dict[str, Any]) -> int:
@@ -76,58 +207,84 @@ class SortingStrategy:
         Returns:
             -1 if a < b, 0 if a == b, 1 if a > b
         """
-        # Handle missing asset_ids
-        a_id = a.get('asset_id', '')
-        b_id = b.get('asset_id', '')
-
-        # Null/empty handling
-        if not a_id and not b_id:
-            return 0
-        if not a_id:
-            return 1  # Empty IDs sort to end
-        if not b_id:
-            return -1
-
-        # Natural sort comparison
-        a_key = SortingStrategy.natural_sort_key(a_id)
-        b_key = SortingStrategy.natural_sort_key(b_id)
-
-        if a_key < b_key:
-            return -1
-        elif a_key > b_key:
-            return 1
-        return 0
+        # Empty IDs carry a sentinel key that sorts to end
+        a_key = _asset_sort_key(a)
+        b_key = _asset_sort_key(b)
+
+        return (a_key > b_key) - (a_key < b_key)
 
     @classmethod
     def sort_assets(cls, assets: List[Dict[str, Any]],
-                   reverse: bool = False) -> List[Dict[str, Any]]:
+                   reverse: bool = False,
+                   sort_fields: bool = True) -> List[Dict[str, Any]]:
         """
         Sort a list of assets by asset_id using natural sorting.
 
         Args:
             assets: List of asset dictionaries
             reverse: Sort in descending order if True
+            sort_fields: Also reorder the fields within each asset by
+                priority; callers that only need the list order can skip it
 
         Returns:
             Sorted list of assets
+
+        Raises:
+            TypeError: If asset IDs have natural keys that cannot be
+                compared (use safe_sort_assets to fall back instead)
         """
-        try:
-            sorted_assets = sorted(
-                assets,
-                key=cmp_to_key(cls.asset_id_comparator),
-                reverse=reverse
-            )
+        sorted_assets = [assets[i] for i in cls.sort_asset_indices(assets, reverse)]
 
-            # Also sort fields within each asset
+        # Also sort fields within each asset
+        if sort_fields:
             for asset in sorted_assets:
                 cls.sort_asset_fields(asset)
 
-            return sorted_assets
+        return sorted_assets
 
-        except Exception as e:
-            logger.error(f"Error sorting assets: {e}")
-            # Return original list if sorting fails
-            return assets
+    @classmethod
+    def sort_asset_indices(cls, assets: List[Dict[str, Any]],
+                           reverse: bool = False) -> List[int]:
+        """
+        Compute the sort_assets order as a permutation of list indices.
+
+        Lets callers that only walk the sorted assets once iterate
+        ``assets[i] for i in order`` without building a sorted list or
+        touching the fields of each asset.
+
+        Args:
+            assets: List of asset dictionaries
+            reverse: Sort in descending order if True
+
+        Returns:
+            Indices into assets, in sorted order
+        """
+        # Set assets without an ID aside once, in input order, so only the
+        # rest go through the natural key sort
+        asset_ids = [asset.get('asset_id') for asset in assets]
+        if all(asset_ids):
+            valid = None
+            empty = []
+        else:
+            valid = [i for i, asset_id in enumerate(asset_ids) if asset_id]
+            empty = [i for i, asset_id in enumerate(asset_ids) if not asset_id]
+            asset_ids = [asset_ids[i] for i in valid]
+
+        keys = None
+        if len(asset_ids) > _NSKEY_CACHE_SIZE:
+            # More IDs than the key cache holds; build all keys in one
+            # pass when they share the prefix + number shape
+            keys = _prefix_number_keys(asset_ids)
+        if keys is None:
+            keys = [_nskey(asset_id) for asset_id in asset_ids]
+
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        if valid is None:
+            return order
+        order = [valid[j] for j in order]
+
+        # Empty IDs sort last, so a descending sort puts them first
+        return empty + order if reverse else order + empty
 
     @classmethod
     def sort_asset_fields(cls, asset: Dict[str, Any]) -> Dict[str, Any]:
@@ -143,21 +300,21 @@ class SortingStrategy:
         if not isinstance(asset, dict):
             return asset
 
-        def field_sort_key(field: str) -> tuple:
-            """Generate sort key for field names."""
-            # Check priority first
-            priority = cls.FIELD_PRIORITY.get(field.lower(), 50)
-            # Then alphabetical
-            return (priority, field.lower())
+        priority_get = cls.FIELD_PRIORITY.get
+
+        # Priority first, then alphabetical; each name is lowered once
+        items = list(asset.items())
+        keys = [(priority_get(field, 50), field)
+                for field in [key.lower() for key in asset]]
 
-        # Create new dict with sorted fields
-        sorted_asset = {}
-        for key in sorted(asset.keys(), key=field_sort_key):
-            sorted_asset[key] = asset[key]
+        # Leave assets whose fields are already in order untouched
+        if all(map(operator.le, keys, keys[1:])):
+            return asset
 
-        # Update original dict to maintain references
+        # Update original dict in place to maintain references
+        order = sorted(range(len(items)), key=keys.__getitem__)
         asset.clear()
-        asset.update(sorted_asset)
+        asset.update(items[i] for i in order)
 
         return asset
 
@@ -172,23 +329,23 @@ class SortingStrategy:
         Returns:
             Sorted list of entries
         """
-        def dif_sort_key(entry: Dict[str, Any]) -> tuple:
-            """Generate sort key for dif entries."""
-            # Primary: asset_id
-            asset_id = entry.get('asset_id', '')
-            # Secondary: operation type (add < modify < delete)
-            op_order = {'add': 1, 'modify': 2, 'delete': 3}
-            operation = entry.get('operation', 'modify')
-            # Tertiary: field name
-            field = entry.get('field', '')
-
-            return (
-                SortingStrategy.natural_sort_key(asset_id),
-                op_order.get(operation, 99),
-                field.lower()
-            )
-
-        return sorted(entries, key=dif_sort_key)
+        return sorted(entries, key=_dif_sort_key)
+
+    @staticmethod
+    def merge_dif_entries(batches: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Merge batches of difference entries that are each already sorted.
+
+        Produces the same order as sort_dif_entries on the concatenated
+        batches with a k-way merge instead of a full re-sort.
+
+        Args:
+            batches: Lists of difference entries, each in sort_dif_entries order
+
+        Returns:
+            Sorted list of entries
+        """
+        return list(heapq.merge(*batches, key=_dif_sort_key))
 
     @staticmethod
     def sort_apl_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -201,22 +358,7 @@ class SortingStrategy:
         Returns:
             Sorted list of entries
         """
-        def apl_sort_key(entry: Dict[str, Any]) -> tuple:
-            """Generate sort key for apl entries."""
-            # Primary: timestamp (if present)
-            timestamp = entry.get('timestamp', '9999-99-99')
-            # Secondary: asset_id
-            asset_id = entry.get('asset_id', '')
-            # Tertiary: sequence number (if present)
-            sequence = entry.get('sequence', 999999)
-
-            return (
-                timestamp,
-                SortingStrategy.natural_sort_key(asset_id),
-                sequence
-            )
-
-        return sorted(entries, key=apl_sort_key)
+        return sorted(entries, key=_apl_sort_key)
 
     @staticmethod
     def handle_edge_cases(value: Any) -> str:
@@ -238,24 +380,9 @@ class SortingStrategy:
         if isinstance(value, (int, float)):
             return str(value)
 
-        # Convert to string and handle special characters
-        text = str(value)
-
-        # Remove or replace problematic characters
-        replacements = {
-            '\n': ' ',
-            '\r': ' ',
-            '\t': ' ',
-            '\0': '',
-        }
-
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-
-        # Normalize whitespace
-        text = ' '.join(text.split())
-
-        return text.strip()
+        # Drop null bytes, then collapse newlines, tabs and other
+        # whitespace runs into single spaces in one split/join
+        return ' '.join(str(value).replace('\0', '').split())
 
     @staticmethod
     def validate_sort_order(items: List[Dict[str, Any]],
@@ -273,8 +400,10 @@ class SortingStrategy:
         if len(items) <= 1:
             return True
 
+        prev_val = items[0].get(key_field)
+        prev_key = None
+
         for i in range(1, len(items)):
-            prev_val = items[i-1].get(key_field)
             curr_val = items[i].get(key_field)
 
             # Handle None values - they should be at the end
@@ -285,12 +414,18 @@ class SortingStrategy:
                 )
                 return False
 
-            # If both are None or current is None, that's valid
-            if prev_val is None or curr_val is None:
+            # If both are None or current is None, that's valid; identical
+            # strings share a key and are always in order
+            if (curr_val is None or prev_val is None or
+                    (type(curr_val) is str and curr_val == prev_val)):
+                prev_val = curr_val
                 continue
 
-            prev_key = SortingStrategy.natural_sort_key(str(prev_val))
-            curr_key = SortingStrategy.natural_sort_key(str(curr_val))
+            # Each value's key is built once and reused as the next
+            # pair's previous key
+            if prev_key is None:
+                prev_key = _nskey(str(prev_val))
+            curr_key = _nskey(str(curr_val))
 
             if prev_key > curr_key:
                 logger.warning(
@@ -299,6 +434,9 @@ class SortingStrategy:
                 )
                 return False
 
+            prev_val = curr_val
+            prev_key = curr_key
+
         return True
 
 
@@ -307,6 +445,90 @@ class FileSorter:
     Handles sorting of file contents for .dif and .apl files.
     """
 
+    @staticmethod
+    def _replace_file(path: Any, output: bytes, backup_path: Optional[Any]) -> None:
+        """
+        Replace a file with new contents through an atomic rename.
+
+        The output is written to a temporary file next to the original,
+        which then takes its place with os.replace. A requested backup is
+        the original file renamed, not a copy, and the file is never left
+        half-written if sorting fails.
+
+        Args:
+            path: File to replace
+            output: New file contents
+            backup_path: Where to keep the original file, or None
+        """
+        import os
+        import shutil
+
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        try:
+            tmp_path.write_bytes(output)
+            shutil.copymode(path, tmp_path)
+            if backup_path is not None:
+                os.replace(path, backup_path)
+                logger.info(f"Created backup: {backup_path}")
+            os.replace(tmp_path, path)
+        except Exception:
+            if backup_path is not None and not path.exists():
+                # Put the original back if it was already moved aside
+                os.replace(backup_path, path)
+                logger.info("Restored from backup due to error")
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def sort_dif_data(data: Any) -> Any:
+        """
+        Sort the contents of a parsed .dif document.
+
+        Args:
+            data: Entry list, or dict with 'entries' and/or 'assets' lists
+
+        Returns:
+            Sorted document; dicts are updated in place
+        """
+        # Sort based on data structure
+        if isinstance(data, list):
+            data = SortingStrategy.sort_dif_entries(data)
+        elif isinstance(data, dict):
+            if 'entries' in data:
+                data['entries'] = SortingStrategy.sort_dif_entries(
+                    data['entries']
+                )
+            if 'assets' in data:
+                # Assets whose IDs cannot be ordered against each other
+                # are logged and kept in file order
+                data['assets'] = safe_sort_assets(data['assets'])
+        return data
+
+    @staticmethod
+    def sort_apl_data(data: Any) -> Any:
+        """
+        Sort the contents of a parsed .apl document.
+
+        Args:
+            data: Entry list, or dict with 'entries' and/or 'changes' lists
+
+        Returns:
+            Sorted document; dicts are updated in place
+        """
+        # Sort based on data structure
+        if isinstance(data, list):
+            data = SortingStrategy.sort_apl_entries(data)
+        elif isinstance(data, dict):
+            if 'entries' in data:
+                data['entries'] = SortingStrategy.sort_apl_entries(
+                    data['entries']
+                )
+            if 'changes' in data:
+                data['changes'] = SortingStrategy.sort_apl_entries(
+                    data['changes']
+                )
+        return data
+
     @staticmethod
     def sort_dif_file(filepath: str, backup: bool = True) -> None:
         """
@@ -314,10 +536,8 @@ class FileSorter:
 
         Args:
             filepath: Path to .dif file
-            backup: Create backup before sorting
+            backup: Keep the original file as a backup when it changes
         """
-        import json
-        import shutil
         from pathlib import Path
 
         path = Path(filepath)
@@ -325,41 +545,25 @@ class FileSorter:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
 
-        if backup:
-            backup_path = path.with_suffix('.dif.bak')
-            shutil.copy2(path, backup_path)
-            logger.info(f"Created backup: {backup_path}")
+        backup_path = path.with_suffix('.dif.bak') if backup else None
 
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-
-            # Sort based on data structure
-            if isinstance(data, list):
-                data = SortingStrategy.sort_dif_entries(data)
-            elif isinstance(data, dict):
-                if 'entries' in data:
-                    data['entries'] = SortingStrategy.sort_dif_entries(
-                        data['entries']
-                    )
-                if 'assets' in data:
-                    data['assets'] = SortingStrategy.sort_assets(
-                        data['assets']
-                    )
-
-            # Write sorted data back
-            with open(path, 'w') as f:
-                json.dump(data, f, indent=2, sort_keys=False)
+            raw = path.read_bytes()
+            data = decode_json(raw)
+            data = FileSorter.sort_dif_data(data)
+
+            # Write sorted data back, unless it was already in order
+            output = _encode_document(data)
+            if output == raw:
+                logger.info(f"File already sorted: {filepath}")
+                return
+
+            FileSorter._replace_file(path, output, backup_path)
 
             logger.info(f"Sorted file: {filepath}")
 
         except Exception as e:
             logger.error(f"Error sorting file {filepath}: {e}")
-            if backup:
-                # Restore from backup on error
-                backup_path = path.with_suffix('.dif.bak')
-                shutil.copy2(backup_path, path)
-                logger.info("Restored from backup due to error")
             raise
 
     @staticmethod
@@ -369,10 +573,8 @@ class FileSorter:
 
         Args:
             filepath: Path to .apl file
-            backup: Create backup before sorting
+            backup: Keep the original file as a backup when it changes
         """
-        import json
-        import shutil
         from pathlib import Path
 
         path = Path(filepath)
@@ -380,78 +582,51 @@ class FileSorter:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
 
-        if backup:
-            backup_path = path.with_suffix('.apl.bak')
-            shutil.copy2(path, backup_path)
-            logger.info(f"Created backup: {backup_path}")
+        backup_path = path.with_suffix('.apl.bak') if backup else None
 
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-
-            # Sort based on data structure
-            if isinstance(data, list):
-                data = SortingStrategy.sort_apl_entries(data)
-            elif isinstance(data, dict):
-                if 'entries' in data:
-                    data['entries'] = SortingStrategy.sort_apl_entries(
-                        data['entries']
-                    )
-                if 'changes' in data:
-                    data['changes'] = SortingStrategy.sort_apl_entries(
-                        data['changes']
-                    )
-
-            # Write sorted data back
-            with open(path, 'w') as f:
-                json.dump(data, f, indent=2, sort_keys=False)
+            raw = path.read_bytes()
+            data = decode_json(raw)
+            data = FileSorter.sort_apl_data(data)
+
+            # Write sorted data back, unless it was already in order
+            output = _encode_document(data)
+            if output == raw:
+                logger.info(f"File already sorted: {filepath}")
+                return
+
+            FileSorter._replace_file(path, output, backup_path)
 
             logger.info(f"Sorted file: {filepath}")
 
         except Exception as e:
             logger.error(f"Error sorting file {filepath}: {e}")
-            if backup:
-                # Restore from backup on error
-                backup_path = path.with_suffix('.apl.bak')
-                shutil.copy2(backup_path, path)
-                logger.info("Restored from backup due to error")
             raise
 
 
+@dataclass
 class SortingConfig:
     """
     Configuration for sorting behavior.
     """
 
-    def __init__(self):
-        self.case_sensitive = False
-        self.reverse_order = False
-        self.null_position = 'last'  # 'first' or 'last'
-        self.numeric_handling = 'natural'  # 'natural' or 'lexical'
-        self.locale = 'en_US'
-        self.stable_sort = True
-        self.duplicate_handling = 'keep_first'  # 'keep_first', 'keep_last', 'error'
+    case_sensitive: bool = False
+    reverse_order: bool = False
+    null_position: str = 'last'  # 'first' or 'last'
+    numeric_handling: str = 'natural'  # 'natural' or 'lexical'
+    locale: str = 'en_US'
+    stable_sort: bool = True
+    duplicate_handling: str = 'keep_first'  # 'keep_first', 'keep_last', 'error'
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
-        return {
-            'case_sensitive': self.case_sensitive,
-            'reverse_order': self.reverse_order,
-            'null_position': self.null_position,
-            'numeric_handling': self.numeric_handling,
-            'locale': self.locale,
-            'stable_sort': self.stable_sort,
-            'duplicate_handling': self.duplicate_handling,
-        }
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SortingConfig':
-        """Create config from dictionary."""
-        config = cls()
-        for key, value in data.items():
-            if hasattr(config, key):
-                setattr(config, key, value)
-        return config
+        """Create config from dictionary, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
 
 
 # Module-level convenience functions
@@ -460,6 +635,16 @@ def sort_assets(assets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return SortingStrategy.sort_assets(assets)
 
 
+def safe_sort_assets(assets: List[Dict[str, Any]],
+                     **kwargs: Any) -> List[Dict[str, Any]]:
+    """Sort assets, logging errors and returning the input list on failure."""
+    try:
+        return SortingStrategy.sort_assets(assets, **kwargs)
+    except Exception as e:
+        logger.error(f"Error sorting assets: {e}")
+        return assets
+
+
 def sort_dif_file(filepath: str) -> None:
     """Sort a .dif file in place."""
     FileSorter.sort_dif_file(filepath)
@@ -477,8 +662,6 @@ def validate_sort_order(items: List[Dict[str, Any]]) -> bool:
 
 if __name__ == "__main__":
     # Example usage and testing
-    import json
-
     # Test data
     test_assets = [
         {'asset_id': 'srv10', 'hostname': 'server10'},
@@ -4,9 +4,16 @@ Integration example showing how the sorter module integrates
 with the merger tool workflow.
 """
 
+import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from sorter import SortingStrategy, FileSorter, sort_assets, validate_sort_order
+from sorter import SortingStrategy, FileSorter, safe_sort_assets, validate_sort_order
+
+# Combined size of the output files above which they are sorted in worker
+# processes; below it, starting the pool costs more than the sorting
+_PARALLEL_SORT_MIN_BYTES = 16 * 1024 * 1024
 
 
 class MergerSorterIntegration:
@@ -23,7 +30,9 @@ class MergerSorterIntegration:
         Process and sort output from the @differ agent.
 
         Args:
-            diff_data: Unsorted difference data from differ
+            diff_data: Unsorted difference data from differ, or a list of
+                entry batches that are each already sorted (for example
+                one per upstream source); batches are merged, not re-sorted
 
         Returns:
             Sorted difference data ready for output
@@ -31,7 +40,10 @@ class MergerSorterIntegration:
         print("Processing differ output...")
 
         # Sort the difference entries
-        if isinstance(diff_data, list):
+        if (isinstance(diff_data, list) and diff_data and
+                all(isinstance(batch, list) for batch in diff_data)):
+            sorted_data = self.sorter.merge_dif_entries(diff_data)
+        elif isinstance(diff_data, list):
             sorted_data = self.sorter.sort_dif_entries(diff_data)
         elif isinstance(diff_data, dict) and 'entries' in diff_data:
             diff_data['entries'] = self.sorter.sort_dif_entries(diff_data['entries'])
@@ -54,8 +66,9 @@ class MergerSorterIntegration:
         """
         print("Preparing assets for TUI display...")
 
-        # Sort assets by ID
-        sorted_assets = sort_assets(assets)
+        # Sort assets by ID; the TUI picks fields by name, so their order
+        # within each asset does not matter here
+        sorted_assets = safe_sort_assets(assets, sort_fields=False)
 
         # Validate sort order
         if validate_sort_order(sorted_assets):
@@ -89,22 +102,40 @@ class MergerSorterIntegration:
         """
         print(f"\nSorting output files in {self.output_dir}...")
 
-        # Sort all .dif files
-        dif_files = list(self.output_dir.glob('*.dif'))
-        for dif_file in dif_files:
-            print(f"  Sorting {dif_file.name}...")
-            try:
-                FileSorter.sort_dif_file(str(dif_file), backup=True)
-                print(f"    ✓ Sorted successfully")
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
+        # Report all .dif files, then all .apl files
+        jobs = [(dif_file, FileSorter.sort_dif_file)
+                for dif_file in self.output_dir.glob('*.dif')]
+        jobs += [(apl_file, FileSorter.sort_apl_file)
+                 for apl_file in self.output_dir.glob('*.apl')]
+
+        total_bytes = sum(sorted_file.stat().st_size for sorted_file, _ in jobs)
+        if len(jobs) > 1 and total_bytes > _PARALLEL_SORT_MIN_BYTES:
+            # Each file is an independent load/sort/dump, so large outputs
+            # are sorted in parallel and reported in the usual order
+            with ProcessPoolExecutor(
+                    max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+                self._report_sorted_files([
+                    (sorted_file, executor.submit(sort_file, str(sorted_file), True).result)
+                    for sorted_file, sort_file in jobs
+                ])
+        else:
+            self._report_sorted_files([
+                (sorted_file, partial(sort_file, str(sorted_file), True))
+                for sorted_file, sort_file in jobs
+            ])
 
-        # Sort all .apl files
-        apl_files = list(self.output_dir.glob('*.apl'))
-        for apl_file in apl_files:
-            print(f"  Sorting {apl_file.name}...")
+    @staticmethod
+    def _report_sorted_files(tasks):
+        """
+        Run file sorting tasks in order and print the outcome of each.
+
+        Args:
+            tasks: (path, callable) pairs; each callable sorts its file
+        """
+        for sorted_file, run in tasks:
+            print(f"  Sorting {sorted_file.name}...")
             try:
-                FileSorter.sort_apl_file(str(apl_file), backup=True)
+                run()
                 print(f"    ✓ Sorted successfully")
             except Exception as e:
                 print(f"    ✗ Error: {e}")
@@ -121,26 +152,26 @@ class MergerSorterIntegration:
         """
         print("\nGenerating sorted report...")
 
-        sorted_assets = sort_assets(assets)
+        sorted_assets = safe_sort_assets(assets)
 
-        # Detect duplicates
+        # Duplicate and null counts do not depend on order, so gather
+        # them in one pass without walking the sorted list again
         seen_ids = {}
-        duplicates = []
-        for asset in sorted_assets:
+        duplicates = set()
+        null_count = 0
+        for asset in assets:
             asset_id = asset.get('asset_id')
-            if asset_id:
-                if asset_id in seen_ids:
-                    duplicates.append(asset_id)
-                else:
-                    seen_ids[asset_id] = True
-
-        # Count null IDs
-        null_count = sum(1 for a in sorted_assets if not a.get('asset_id'))
+            if not asset_id:
+                null_count += 1
+            elif asset_id in seen_ids:
+                duplicates.add(asset_id)
+            else:
+                seen_ids[asset_id] = True
 
         report = {
             'total_assets': len(sorted_assets),
             'unique_ids': len(seen_ids),
-            'duplicate_ids': len(set(duplicates)),
+            'duplicate_ids': len(duplicates),
             'null_ids': null_count,
             'sorted_assets': sorted_assets,
             'validation_passed': validate_sort_order(sorted_assets)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Log Analyzer Search
+Validates that the memory-mapped literal search matches the line-by-line
+regex search.
+"""
+
+import unittest
+import random
+import tempfile
+from pathlib import Path
+from unittest import mock
+from logger import LogAnalyzer
+
+
+class TestLiteralSearch(unittest.TestCase):
+    """Test LogAnalyzer.search on the literal-pattern path."""
+
+    WORDS = ['srv1', 'SRV10', 'Srv', 'rv1', 'host', 'error', 'Zürich',
+             '\u212a', 'ok', '']
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'merger.log'
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, text: str):
+        self.path.write_bytes(text.encode('utf-8'))
+        return LogAnalyzer(str(self.path))
+
+    def _regex_search(self, analyzer, pattern, context_lines):
+        # Without a literal hint, search() tests every line with the regex
+        with mock.patch('logger._literal_hint', return_value=None):
+            return analyzer.search(pattern, context_lines)
+
+    def _assert_same(self, analyzer, pattern, context_lines, block_size):
+        with mock.patch('logger._SEARCH_BLOCK_SIZE', block_size):
+            mapped = analyzer.search(pattern, context_lines)
+        self.assertEqual(
+            mapped, self._regex_search(analyzer, pattern, context_lines),
+            f"pattern={pattern!r} context={context_lines} block={block_size}"
+        )
+        return mapped
+
+    def test_matches_regex_search(self):
+        """Test random logs across block sizes and context widths."""
+        for seed in range(20):
+            rng = random.Random(seed)
+            lines = [' '.join(rng.choices(self.WORDS, k=rng.randint(0, 4)))
+                     for _ in range(rng.randint(1, 60))]
+            text = '\n'.join(lines)
+            if rng.random() < 0.5:
+                text += '\n'
+            analyzer = self._write(text)
+
+            for pattern in ('srv1', 'rv', 'k', 'host error'):
+                for context_lines in (0, 1, 3):
+                    for block_size in (4, 7, 64, 1 << 20):
+                        self._assert_same(analyzer, pattern, context_lines,
+                                          block_size)
+
+    def test_context_merging(self):
+        """Test that overlapping context windows emit each line once."""
+        analyzer = self._write(
+            'a\nmatch 1\nb\nmatch 2\nc\nd\ne\nf\nmatch 3\ng\n'
+        )
+        found = self._assert_same(analyzer, 'match', 1, 1 << 20)
+
+        self.assertEqual([num for num, _ in found], [1, 2, 3, 4, 5, 8, 9, 10])
+
+    def test_match_across_block_boundary(self):
+        """Test an occurrence that straddles two blocks."""
+        analyzer = self._write('xxxxx\nyyySRV1zzz\nsrv1\n')
+
+        for block_size in range(1, 20):
+            found = self._assert_same(analyzer, 'srv1', 0, block_size)
+            self.assertEqual(found, [(2, 'yyySRV1zzz'), (3, 'srv1')])
+
+    def test_last_line_without_newline(self):
+        """Test a match and context on a final line with no newline."""
+        analyzer = self._write('first\nsecond\nlast srv1')
+
+        found = self._assert_same(analyzer, 'srv1', 2, 1 << 20)
+        self.assertEqual(found, [(1, 'first'), (2, 'second'), (3, 'last srv1')])
+
+    def test_non_ascii_case_folding(self):
+        """Test that lines only matching through Unicode case folding are found."""
+        # U+212A KELVIN SIGN folds to 'k'
+        analyzer = self._write('plain\n\u212aelvin\nkelvin\n')
+
+        found = self._assert_same(analyzer, 'kelvin', 0, 1 << 20)
+        self.assertEqual([num for num, _ in found], [2, 3])
+
+    def test_empty_file(self):
+        """Test searching an empty log."""
+        analyzer = self._write('')
+        self.assertEqual(analyzer.search('srv1', 1), [])
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
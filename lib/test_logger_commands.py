@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Logger Command Execution
+Validates output capping and timeouts of executed commands.
+"""
+
+import unittest
+import sys
+import time
+import tempfile
+from logger import MergerLogger
+
+
+class TestCappedExecution(unittest.TestCase):
+    """Test execute_command with max_output."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.logger = MergerLogger(output_dir=self._tmp.name,
+                                   console_output=False)
+
+    def tearDown(self):
+        self.logger.close()
+        self._tmp.cleanup()
+
+    def test_output_truncated(self):
+        """Test that only the first max_output bytes of each stream are kept."""
+        script = ("import sys; sys.stdout.write('o' * 200000); "
+                  "sys.stderr.write('e' * 200000)")
+        result = self.logger.execute_command(
+            [sys.executable, '-c', script], max_output=100
+        )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['stdout'], 'o' * 100)
+        self.assertEqual(result['stderr'], 'e' * 100)
+
+    def test_output_under_limit(self):
+        """Test that short output is kept whole."""
+        result = self.logger.execute_command(
+            [sys.executable, '-c', "print('ok')"], max_output=100
+        )
+
+        self.assertEqual(result['exit_code'], 0)
+        self.assertEqual(result['stdout'], 'ok\n')
+
+    def test_timeout(self):
+        """Test that a timeout returns on time even if a child keeps the pipes."""
+        start = time.time()
+        result = self.logger.execute_command(
+            ['sh', '-c', 'sleep 4 & sleep 3'], timeout=1, max_output=100
+        )
+        elapsed = time.time() - start
+
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], "Command timed out after 1s")
+        self.assertLess(elapsed, 2.5)
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
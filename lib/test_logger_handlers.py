@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Logger Handlers
+Validates the queue listeners and file handlers behind MergerLogger.
+"""
+
+import unittest
+import sys
+import time
+import logging
+import threading
+import tempfile
+import subprocess
+from pathlib import Path
+from logger import MergerLogger, BufferedRotatingFileHandler
+
+
+class TestQueueListeners(unittest.TestCase):
+    """Test the background listeners that write log records."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _logger(self):
+        logger = MergerLogger(output_dir=self.tmp, console_output=False)
+        self.addCleanup(logger.close)
+        return logger
+
+    def test_flush_writes_queued_records(self):
+        """Test that flush() returns once every record is on disk."""
+        logger = self._logger()
+        for i in range(500):
+            logger.info("SYSTEM", f"message {i}")
+        logger.flush()
+
+        lines = (self.tmp / 'merger.log').read_text().splitlines()
+        self.assertTrue(lines[-1].endswith('message 499'))
+
+        # The listener keeps running after a flush
+        logger.info("SYSTEM", "after flush")
+        logger.flush()
+        self.assertIn('after flush', (self.tmp / 'merger.log').read_text())
+
+    def test_close_detaches_handlers(self):
+        """Test that close() stops the listeners and removes their handlers."""
+        threads = threading.active_count()
+        logger = self._logger()
+        self.assertGreater(threading.active_count(), threads)
+
+        logger.info("SYSTEM", "last message")
+        logger.close()
+        logger.close()
+
+        self.assertEqual(logger.logger.handlers, [])
+        self.assertEqual(logger.command_logger.handlers, [])
+        self.assertEqual(threading.active_count(), threads)
+        self.assertIn('last message', (self.tmp / 'merger.log').read_text())
+
+    def test_new_logger_stops_old_listeners(self):
+        """Test that setting up a second logger stops the first one's threads."""
+        threads = threading.active_count()
+        self._logger()
+        second = self._logger()
+
+        second.close()
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_concurrent_flush_and_close(self):
+        """Test that flush, replay and close can run from several threads."""
+        logger = self._logger()
+        logger.log_command(command="zbx host.get", exit_code=0, duration=0.1)
+        errors = []
+
+        def worker(action):
+            try:
+                for _ in range(50):
+                    action()
+            except Exception as e:
+                errors.append(e)
+
+        workers = [
+            threading.Thread(target=worker, args=(logger.flush,)),
+            threading.Thread(target=worker, args=(logger.flush,)),
+            threading.Thread(target=worker, args=(logger.replay_commands,)),
+        ]
+        for thread in workers:
+            thread.start()
+        logger.close()
+        for thread in workers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+
+class TestBufferedRotatingFileHandler(unittest.TestCase):
+    """Test the buffered rotating log file handler."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.path = self.tmp / 'buffered.log'
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _handler(self, **kwargs):
+        handler = BufferedRotatingFileHandler(self.path, flush_interval=60,
+                                              **kwargs)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.addCleanup(handler.close)
+        return handler
+
+    @staticmethod
+    def _record(message, level=logging.INFO):
+        return logging.LogRecord('merger', level, __file__, 1, message,
+                                 None, None)
+
+    def test_records_stay_buffered(self):
+        """Test that INFO records wait in the buffer and WARNING flushes."""
+        handler = self._handler()
+        handler.emit(self._record('buffered'))
+        self.assertEqual(self.path.read_text(), '')
+
+        handler.emit(self._record('warning', logging.WARNING))
+        self.assertEqual(self.path.read_text(), 'buffered\nwarning\n')
+
+    def test_rotation_with_full_buffer(self):
+        """Test that rotating with buffered records loses and reorders nothing."""
+        handler = self._handler(maxBytes=4096, backupCount=50,
+                                buffer_size=64 * 1024)
+        messages = [f'record {i:05d} ' + 'x' * 80 for i in range(1000)]
+        for message in messages:
+            handler.emit(self._record(message))
+        handler.close()
+
+        backups = sorted(self.tmp.glob('buffered.log.*'),
+                         key=lambda path: int(path.suffix[1:]), reverse=True)
+        self.assertGreater(len(backups), 1)
+        written = []
+        for path in backups + [self.path]:
+            self.assertLessEqual(path.stat().st_size, 4096)
+            written.extend(path.read_text().splitlines())
+        self.assertEqual(written, messages)
+
+    def test_close_flushes_remaining_records(self):
+        """Test that close() writes records still in the buffer."""
+        handler = self._handler()
+        for i in range(10):
+            handler.emit(self._record(f'message {i}'))
+        self.assertEqual(self.path.read_text(), '')
+
+        handler.close()
+        self.assertEqual(self.path.read_text().splitlines(),
+                         [f'message {i}' for i in range(10)])
+        self.assertFalse(handler._flusher.is_alive())
+
+    def test_periodic_flush(self):
+        """Test that the flusher thread writes buffered records."""
+        handler = BufferedRotatingFileHandler(self.path, flush_interval=0.05)
+        self.addCleanup(handler.close)
+        handler.emit(self._record('periodic'))
+
+        time.sleep(0.5)
+        self.assertEqual(self.path.read_text(), 'periodic\n')
+
+    def test_atexit_shutdown(self):
+        """Test that buffered records are written when the interpreter exits."""
+        script = (
+            "import sys, logging\n"
+            "from logger import MergerLogger, BufferedRotatingFileHandler\n"
+            "out = sys.argv[1]\n"
+            "merger = MergerLogger(output_dir=out, console_output=False)\n"
+            "merger.info('SYSTEM', 'merger record')\n"
+            "handler = BufferedRotatingFileHandler(out + '/plain.log',\n"
+            "                                      flush_interval=60)\n"
+            "handler.emit(logging.makeLogRecord({'msg': 'plain record'}))\n"
+        )
+        subprocess.run([sys.executable, '-c', script, str(self.tmp)],
+                       cwd=Path(__file__).parent, check=True, timeout=30)
+
+        self.assertIn('merger record', (self.tmp / 'merger.log').read_text())
+        self.assertEqual((self.tmp / 'plain.log').read_text(),
+                         'plain record\n')
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Logger JSON Formatting
+Validates that structured log records encode every value they carry.
+"""
+
+import unittest
+import json
+import logging
+from logger import JsonFormatter, CommandJsonFormatter
+
+
+class TestJsonFormatter(unittest.TestCase):
+    """Test JSON encoding of log records."""
+
+    def _record(self, **extra):
+        record = logging.LogRecord('merger', logging.INFO, __file__, 1,
+                                   'Synced assets', None, None)
+        record.__dict__.update(extra)
+        return record
+
+    def test_extra_fields(self):
+        """Test that extra fields are written next to the standard ones."""
+        entry = json.loads(JsonFormatter().format(
+            self._record(agent='DIFFER', asset_id='srv1')
+        ))
+
+        self.assertEqual(entry['agent'], 'DIFFER')
+        self.assertEqual(entry['asset_id'], 'srv1')
+        self.assertEqual(entry['message'], 'Synced assets')
+
+    def test_int_keys_and_big_ints(self):
+        """Test that int dict keys and integers beyond 64 bits are kept."""
+        line = JsonFormatter().format(self._record(
+            counts={1: 2}, serial=123456789012345678901234
+        ))
+        entry = json.loads(line)
+
+        self.assertEqual(entry['counts'], {'1': 2})
+        self.assertEqual(entry['serial'], 123456789012345678901234)
+
+        line = JsonFormatter().format(self._record(counts={1: 2}))
+        self.assertEqual(json.loads(line)['counts'], {'1': 2})
+
+    def test_command_entry(self):
+        """Test that a finished command entry is written as given."""
+        command = {'command': 'zbx host.get', 'exit_code': 0,
+                   'duration': 0.5, 'request_id': 2 ** 70}
+        line = CommandJsonFormatter().format(self._record(_cmd=command))
+
+        self.assertEqual(json.loads(line), command)
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Logger Command Masking
+Validates that sensitive command-line values never reach the logs.
+"""
+
+import unittest
+import tempfile
+from logger import MergerLogger
+
+
+class TestSensitiveDataMasking(unittest.TestCase):
+    """Test masking of sensitive command data."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.logger = MergerLogger(output_dir=self._tmp.name,
+                                   console_output=False)
+
+    def tearDown(self):
+        self.logger.close()
+        self._tmp.cleanup()
+
+    def test_flag_values(self):
+        """Test masking of flag, pair and bearer token values."""
+        masked = self.logger._mask_sensitive_data(
+            "topdesk --password s3cret --token=abc get password=pw Bearer xyz"
+        )
+        self.assertEqual(
+            masked,
+            "topdesk --password=*** --token=*** get password=*** Bearer ***"
+        )
+
+    def test_chained_flags(self):
+        """Test that a flag without a value does not swallow the next one."""
+        masked = self.logger._mask_sensitive_data(
+            "zbx --api-key --password hunter2"
+        )
+        self.assertNotIn('hunter2', masked)
+        self.assertEqual(masked, "zbx --api-key --password=***")
+
+    def test_overlapping_patterns(self):
+        """Test that a value taken by one pattern still gets masked by another."""
+        masked = self.logger._mask_sensitive_data(
+            "topdesk Bearer --password hunter2 --token password=pw"
+        )
+        self.assertNotIn('hunter2', masked)
+        self.assertNotIn('pw', masked)
+        self.assertEqual(masked, "topdesk Bearer *** --token=***")
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
@@ -7,12 +7,14 @@ Validates deterministic sorting behavior and edge case handling.
 import unittest
 import json
 import tempfile
+from itertools import islice
 from pathlib import Path
 from sorter import (
     SortingStrategy,
     FileSorter,
     SortingConfig,
     sort_assets,
+    safe_sort_assets,
     validate_sort_order
 )
 
@@ -46,9 +48,10 @@ class TestNaturalSorting(unittest.TestCase):
         sorted_items = sorted(items, key=SortingStrategy.natural_sort_key)
 
         # Verify natural sorting is applied (numbers sorted correctly)
-        # Find indices of numbered assets to verify order
-        asset_indices = [i for i, item in enumerate(sorted_items) if 'ASSET' in item.upper()]
-        asset_values = [sorted_items[i] for i in asset_indices]
+        # Take the first three numbered assets to verify order
+        asset_values = list(islice(
+            (item for item in sorted_items if 'ASSET' in item.upper()), 3
+        ))
 
         # Check that ASSET-001, ASSET-2, ASSET-10 are in correct order
         self.assertIn('ASSET-001', asset_values[0].upper())
@@ -101,17 +104,42 @@ class TestAssetSorting(unittest.TestCase):
         }
 
         sorted_asset = SortingStrategy.sort_asset_fields(asset)
-        fields = list(sorted_asset.keys())
+        positions = {field: i for i, field in enumerate(sorted_asset)}
 
         # Check priority fields come first
-        self.assertEqual(fields[0], 'asset_id')
-        self.assertIn('ip_address', fields[:3])
-        self.assertIn('hostname', fields[:3])
+        self.assertEqual(positions['asset_id'], 0)
+        self.assertLess(positions['ip_address'], 3)
+        self.assertLess(positions['hostname'], 3)
 
         # Check low priority fields come last
-        notes_index = fields.index('notes')
-        created_index = fields.index('created_date')
-        self.assertGreater(notes_index, created_index)
+        self.assertGreater(positions['notes'], positions['created_date'])
+
+    def test_skip_field_sorting(self):
+        """Test that field order is kept when field sorting is disabled."""
+        assets = [
+            {'notes': 'b', 'asset_id': 'srv2'},
+            {'notes': 'a', 'asset_id': 'srv1'},
+        ]
+        sorted_assets = SortingStrategy.sort_assets(assets, sort_fields=False)
+
+        self.assertEqual([a['asset_id'] for a in sorted_assets], ['srv1', 'srv2'])
+        self.assertEqual(list(sorted_assets[0].keys()), ['notes', 'asset_id'])
+
+    def test_sort_asset_indices(self):
+        """Test index permutation matches the sorted asset order."""
+        assets = [
+            {'asset_id': 'srv10'},
+            {'asset_id': None},
+            {'asset_id': 'srv2'},
+            {'asset_id': 'srv1'},
+        ]
+        order = SortingStrategy.sort_asset_indices(assets)
+
+        self.assertEqual(order, [3, 2, 0, 1])
+        self.assertEqual(
+            [assets[i] for i in order],
+            SortingStrategy.sort_assets(assets, sort_fields=False)
+        )
 
 
 class TestEdgeCases(unittest.TestCase):
@@ -149,6 +177,23 @@ class TestEdgeCases(unittest.TestCase):
         if len(dup_assets) == 2:
             self.assertEqual(dup_assets[0]['value'], 'first')
 
+    def test_unhashable_asset_ids(self):
+        """Test that list or dict asset IDs still get a natural key."""
+        self.assertEqual(SortingStrategy.natural_sort_key(['a']), ["['a']"])
+
+        assets = [{'asset_id': ['b']}, {'asset_id': {'id': 'a'}}]
+        sorted_assets = sort_assets(assets)
+        self.assertEqual(sorted_assets[0]['asset_id'], ['b'])
+
+    def test_incomparable_asset_ids(self):
+        """Test that safe sorting falls back to the input on key errors."""
+        assets = [{'asset_id': 'srv1'}, {'asset_id': '10'}]
+
+        with self.assertRaises(TypeError):
+            sort_assets(assets)
+
+        self.assertIs(safe_sort_assets(assets), assets)
+
 
 class TestDifSorting(unittest.TestCase):
     """Test .dif file entry sorting."""
@@ -173,6 +218,23 @@ class TestDifSorting(unittest.TestCase):
         self.assertEqual(srv1_entries[0]['operation'], 'add')
         self.assertEqual(srv1_entries[1]['operation'], 'modify')
 
+    def test_dif_batch_merging(self):
+        """Test merging of already sorted difference entry batches."""
+        batches = [
+            [
+                {'asset_id': 'srv1', 'operation': 'add', 'field': 'hostname'},
+                {'asset_id': 'srv10', 'operation': 'delete', 'field': 'notes'},
+            ],
+            [
+                {'asset_id': 'srv1', 'operation': 'modify', 'field': 'ip'},
+                {'asset_id': 'srv2', 'operation': 'add', 'field': 'model'},
+            ],
+        ]
+
+        merged = SortingStrategy.merge_dif_entries(batches)
+        expected = SortingStrategy.sort_dif_entries(batches[0] + batches[1])
+        self.assertEqual(merged, expected)
+
 
 class TestAplSorting(unittest.TestCase):
     """Test .apl file entry sorting."""
@@ -202,6 +264,34 @@ class TestAplSorting(unittest.TestCase):
 class TestFileSorting(unittest.TestCase):
     """Test file-based sorting operations."""
 
+    @classmethod
+    def setUpClass(cls):
+        # One private directory per class keeps parallel workers apart
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmp = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_dif_data_sorting(self):
+        """Test sorting of parsed .dif document contents."""
+        data = {
+            'entries': [
+                {'asset_id': 'srv10', 'change': 'update'},
+                {'asset_id': 'srv2', 'change': 'create'},
+                {'asset_id': 'srv1', 'change': 'delete'},
+            ]
+        }
+
+        sorted_data = FileSorter.sort_dif_data(data)
+
+        entries = sorted_data['entries']
+        self.assertEqual(
+            [e['asset_id'] for e in entries],
+            ['srv1', 'srv2', 'srv10']
+        )
+
     def test_dif_file_sorting(self):
         """Test sorting of .dif file contents."""
         # Create temp file with unsorted data
@@ -213,29 +303,81 @@ class TestFileSorting(unittest.TestCase):
             ]
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.dif',
-            delete=False
-        ) as f:
+        temp_path = self.tmp / 'test_dif_file_sorting.dif'
+        with open(temp_path, 'w') as f:
+            json.dump(data, f)
+
+        # Sort the file
+        FileSorter.sort_dif_file(temp_path, backup=False)
+
+        # Read and verify
+        with open(temp_path, 'r') as f:
+            sorted_data = json.load(f)
+
+        entries = sorted_data['entries']
+        self.assertEqual(entries[0]['asset_id'], 'srv1')
+        self.assertEqual(entries[1]['asset_id'], 'srv2')
+        self.assertEqual(entries[2]['asset_id'], 'srv10')
+
+    def test_dif_file_output_bytes(self):
+        """Test that sorted files are written in one canonical encoding."""
+        temp_path = self.tmp / 'test_dif_file_output_bytes.dif'
+        temp_path.write_bytes(
+            b'[{"asset_id": "srv2", "location": "Z\xc3\xbcrich", "load": 1e-7},'
+            b' {"asset_id": "srv1", "load": 0.5}]'
+        )
+
+        FileSorter.sort_dif_file(temp_path, backup=False)
+
+        self.assertEqual(
+            temp_path.read_bytes(),
+            b'[\n'
+            b'  {\n'
+            b'    "asset_id": "srv1",\n'
+            b'    "load": 0.5\n'
+            b'  },\n'
+            b'  {\n'
+            b'    "asset_id": "srv2",\n'
+            b'    "location": "Z\\u00fcrich",\n'
+            b'    "load": 1e-07\n'
+            b'  }\n'
+            b']'
+        )
+
+    def test_dif_file_mixed_asset_ids(self):
+        """Test that assets with incomparable IDs are still written."""
+        data = {
+            'entries': [{'asset_id': 'srv2'}, {'asset_id': 'srv1'}],
+            'assets': [{'name': 'b', 'asset_id': 'srv1'}, {'asset_id': '10'}]
+        }
+        temp_path = self.tmp / 'test_dif_file_mixed_asset_ids.dif'
+        with open(temp_path, 'w') as f:
             json.dump(data, f)
-            temp_path = f.name
 
-        try:
-            # Sort the file
+        with self.assertLogs('sorter', level='ERROR'):
             FileSorter.sort_dif_file(temp_path, backup=False)
 
-            # Read and verify
-            with open(temp_path, 'r') as f:
-                sorted_data = json.load(f)
+        with open(temp_path) as f:
+            sorted_data = json.load(f)
+        self.assertEqual(sorted_data['assets'], data['assets'])
+        self.assertEqual([e['asset_id'] for e in sorted_data['entries']],
+                         ['srv1', 'srv2'])
+
+    def test_dif_file_big_integers(self):
+        """Test that integers beyond 64 bits survive a sort unchanged."""
+        for serial in (-9999999999999999999, 18446744073709551616,
+                       123456789012345678901234):
+            temp_path = self.tmp / 'test_dif_file_big_integers.dif'
+            temp_path.write_text(
+                f'[{{"asset_id": "srv2", "serial": {serial}}},'
+                f' {{"asset_id": "srv1", "serial": 1}}]'
+            )
 
-            entries = sorted_data['entries']
-            self.assertEqual(entries[0]['asset_id'], 'srv1')
-            self.assertEqual(entries[1]['asset_id'], 'srv2')
-            self.assertEqual(entries[2]['asset_id'], 'srv10')
+            FileSorter.sort_dif_file(temp_path, backup=False)
 
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+            with open(temp_path) as f:
+                entries = json.load(f)
+            self.assertEqual(entries[1]['serial'], serial)
 
 
 class TestValidation(unittest.TestCase):
@@ -8,9 +8,9 @@ the authentication is properly configured.
 
 import os
 import sys
+import shutil
 import subprocess
 import json
-import base64
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -22,6 +22,15 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+# Shared HTTP session so repeated API probes reuse the pooled keep-alive
+# connection instead of paying a new TCP/TLS handshake per request; it is
+# configured like the one APLProcessor uses for its API calls
+if REQUESTS_AVAILABLE:
+    from apply import create_http_session
+    _SESSION = create_http_session()
+else:
+    _SESSION = None
+
 
 def test_environment_variables():
     """Check if required environment variables are set."""
@@ -68,18 +77,11 @@ def test_cli_availability():
     found_cli = None
 
     for cmd in cli_commands:
-        try:
-            result = subprocess.run(
-                ['which', cmd],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                print(f"✅ Found {cmd} at: {result.stdout.strip()}")
-                found_cli = cmd
-                break
-        except Exception:
-            continue
+        path = shutil.which(cmd)
+        if path:
+            print(f"✅ Found {cmd} at: {path}")
+            found_cli = cmd
+            break
 
     if not found_cli:
         print("❌ topdesk command not found")
@@ -155,13 +157,10 @@ def test_api_connection():
         print("❌ Missing required environment variables for API test")
         return False
 
-    # Create basic auth header
-    auth_string = f"{username}:{api_key}"
-    auth_bytes = auth_string.encode('ascii')
-    auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
+    # Basic auth is encoded by requests when the request is prepared
+    auth = requests.auth.HTTPBasicAuth(username, api_key)
 
     headers = {
-        'Authorization': f'Basic {auth_b64}',
         'Content-Type': 'application/json'
     }
 
@@ -171,9 +170,10 @@ def test_api_connection():
     print(f"Testing: {test_url}")
 
     try:
-        response = requests.get(
+        response = _SESSION.get(
             test_url,
             headers=headers,
+            auth=auth,
             params={'pageSize': 1},
             timeout=30,
             verify=True  # Enable SSL verification
@@ -26,6 +26,28 @@ from pathlib import Path
 from collections import defaultdict
 from enum import Enum
 
+from json_codec import decode_json
+
+# Dotted-quad IPv4 address with each octet in 0-255 (leading zeros allowed)
+_IPV4_OCTET = r'0*(?:25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])'
+_IPV4_ADDRESS = re.compile(rf'(?:{_IPV4_OCTET}\.){{3}}{_IPV4_OCTET}').fullmatch
+
+
+def _load_json_file(filepath: Any) -> Any:
+    """
+    Parse a JSON file with the shared decoder (orjson when installed).
+
+    Args:
+        filepath: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return decode_json(Path(filepath).read_bytes())
+
 
 class ValidationStatus(Enum):
     """Validation status levels."""
@@ -170,6 +192,9 @@ class MergerValidator:
     # Valid status values for .apl files
     VALID_APL_STATUS = {'applied', 'failed', 'skipped', 'pending'}
 
+    # Expected status values for assets
+    VALID_ASSET_STATUS = {'active', 'inactive', 'maintenance', 'retired', 'unknown'}
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the validator.
@@ -185,8 +210,7 @@ class MergerValidator:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return _load_json_file(config_path)
         except Exception as e:
             self.logger.warning(f"Could not load config: {e}")
             return {}
@@ -211,8 +235,7 @@ class MergerValidator:
                 return result
 
             # Load and parse JSON
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = _load_json_file(filepath)
 
             result.add_check(True, "JSON structure valid")
 
@@ -305,8 +328,7 @@ class MergerValidator:
                 return result
 
             # Load and parse JSON
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = _load_json_file(filepath)
 
             result.add_check(True, "JSON structure valid")
 
@@ -435,7 +457,7 @@ class MergerValidator:
             self._validate_asset_fields(asset, result, i)
 
             # Check for unexpected fields
-            unexpected = set(asset.keys()) - self.EXPECTED_ASSET_FIELDS
+            unexpected = asset.keys() - self.EXPECTED_ASSET_FIELDS
             if unexpected and len(unexpected) <= 3:
                 result.add_info(f"Asset {i}: Unexpected fields: {unexpected}")
 
@@ -466,20 +488,13 @@ class MergerValidator:
         # Status validation
         if 'status' in asset and asset['status']:
             status = asset['status'].lower()
-            valid_statuses = {'active', 'inactive', 'maintenance', 'retired', 'unknown'}
-            if status not in valid_statuses:
+            if status not in self.VALID_ASSET_STATUS:
                 result.add_warning(f"Asset {index}: Unusual status value: {asset['status']}")
 
     def _is_valid_ip(self, ip: str) -> bool:
         """Check if string is a valid IP address."""
         # Simple IPv4 validation
-        parts = ip.split('.')
-        if len(parts) != 4:
-            return False
-        try:
-            return all(0 <= int(part) <= 255 for part in parts)
-        except ValueError:
-            return False
+        return _IPV4_ADDRESS(ip) is not None
 
     def validate_data_sync(self,
                           source_data: List[Dict],
@@ -502,10 +517,12 @@ class MergerValidator:
         try:
             mappings = field_mappings or self.FIELD_MAPPINGS
 
-            # Build lookup dictionaries
+            # Build lookup dictionaries; the source ID field is resolved
+            # once instead of searching the mappings for every item
+            source_id_field = self._get_mapped_field('asset_id', mappings)
             source_by_id = {}
             for item in source_data:
-                asset_id = self._get_mapped_value(item, 'asset_id', mappings)
+                asset_id = item.get(source_id_field)
                 if asset_id:
                     source_by_id[asset_id] = item
 
@@ -516,8 +533,9 @@ class MergerValidator:
                     target_by_id[asset_id] = item
 
             # Check for missing assets
-            missing_in_target = set(source_by_id.keys()) - set(target_by_id.keys())
-            missing_in_source = set(target_by_id.keys()) - set(source_by_id.keys())
+            missing_in_target = source_by_id.keys() - target_by_id.keys()
+            missing_in_source = target_by_id.keys() - source_by_id.keys()
+            common_ids = source_by_id.keys() & target_by_id.keys()
 
             if missing_in_target:
                 result.add_warning(f"{len(missing_in_target)} assets in source not found in target")
@@ -528,7 +546,7 @@ class MergerValidator:
 
             # Check field synchronization
             sync_errors = 0
-            for asset_id in source_by_id.keys() & target_by_id.keys():
+            for asset_id in common_ids:
                 source_asset = source_by_id[asset_id]
                 target_asset = target_by_id[asset_id]
 
@@ -546,7 +564,7 @@ class MergerValidator:
                                 )
 
             result.metadata['sync_errors'] = sync_errors
-            result.metadata['assets_compared'] = len(source_by_id.keys() & target_by_id.keys())
+            result.metadata['assets_compared'] = len(common_ids)
 
             result.add_check(sync_errors == 0, f"Field synchronization ({sync_errors} mismatches)")
 
@@ -558,13 +576,13 @@ class MergerValidator:
         self.validation_history.append(result)
         return result
 
-    def _get_mapped_value(self, data: Dict, target_field: str, mappings: Dict) -> Any:
-        """Get value from data using field mapping."""
+    def _get_mapped_field(self, target_field: str, mappings: Dict) -> str:
+        """Get the source field that maps to a target field."""
         # Reverse lookup in mappings
         for source_field, mapped_field in mappings.items():
             if mapped_field == target_field:
-                return data.get(source_field)
-        return data.get(target_field)
+                return source_field
+        return target_field
 
     def validate_cache_integrity(self, cache_dir: str) -> ValidationResult:
         """
@@ -591,8 +609,7 @@ class MergerValidator:
             for cache_file in cache_files:
                 # Check file readability
                 try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
+                    data = _load_json_file(cache_file)
                     result.add_check(True, f"Cache file readable: {cache_file.name}")
 
                     # Check structure
@@ -37,6 +37,9 @@ except ValueError as e:
 logger.info("SYSTEM", "Process completed", 
            duration_seconds=45.3, total_assets=150, modified=23, failed=2)
 
+# Records are written by a background thread; wait for them
+logger.flush()
+
 print("JSON log created at: test_output/merger_json.log")
 print("\nSample JSON entries:")
 with open("test_output/merger_json.log", "r") as f:
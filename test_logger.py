@@ -197,6 +197,9 @@ def main():
     print("\n" + "=" * 60)
     logger.print_statistics()
     
+    # Records are written by a background thread; wait for them
+    logger.flush()
+    
     # Show log file location
     log_path = Path(config['logging']['output_dir']) / config['logging']['filename']
     print(f"\nLog file created at: {log_path.absolute()}")